@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import List, Union, Optional, Iterable
+from typing import List, Union, Optional, Iterable, Tuple, Dict, Callable, FrozenSet, Sequence
 
-from meross_iot.model.enums import OnlineStatus, Namespace
+from meross_iot.model.enums import OnlineStatus, Namespace, parse_online_status
 from meross_iot.model.http.device import HttpDeviceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _build_dispatch_table(cls: type, handlers_attribute: str) -> Dict[Namespace, Tuple[Callable, ...]]:
+    """
+    Merges the namespace -> handler-name maps declared by every class in the MRO of the given class
+    into a single namespace -> handlers table.
+    :param cls: class whose MRO should be inspected
+    :param handlers_attribute: name of the class attribute holding the namespace -> handler-name map
+    :return:
+    """
+    table = {}
+    for klass in cls.__mro__:
+        for namespace, handler_name in vars(klass).get(handlers_attribute, {}).items():
+            handler = getattr(cls, handler_name)
+            handlers = table.setdefault(namespace, [])
+            if handler not in handlers:
+                handlers.append(handler)
+    return {namespace: tuple(handlers) for namespace, handlers in table.items()}
+
+
 class BaseDevice(object):
     """
     A `BaseDevice` is a generic representation of a Meross device.
@@ -16,21 +35,52 @@ class BaseDevice(object):
     name, type (i.e. device specific model), firmware/hardware version, a Meross internal
     identifier, a library assigned internal identifier.
     """
+    __slots__ = ('_uuid', '_manager', '_channel_names', '_channel_types', '_channel_master_mask', '_channel_by_name',
+                 '_channels', '_name', '_type', '_fwversion', '_hwversion', '_online', '_is_online',
+                 '_abilities', '_str_cache')
+
+    # Mixins declare the namespaces they handle as {namespace: handler-method-name} maps. Every derived class
+    # merges the maps found along its MRO into the following dispatch tables, once, at class creation time.
+    _PUSH_DISPATCH: Dict[Namespace, Tuple[Callable, ...]] = {}
+    _UPDATE_DISPATCH: Dict[Namespace, Tuple[Callable, ...]] = {}
+
+    # Set of every push-notification namespace handled by this class, or None when any namespace might be.
+    # Classes that override handle_push_notification (rather than declaring _PUSH_HANDLERS) should list
+    # their namespaces in their own _HANDLED_NAMESPACES: if they don't, every push is delivered to them.
+    _PUSH_NAMESPACES: Optional[FrozenSet[Namespace]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._PUSH_DISPATCH = _build_dispatch_table(cls, '_PUSH_HANDLERS')
+        cls._UPDATE_DISPATCH = _build_dispatch_table(cls, '_UPDATE_HANDLERS')
+        if any('handle_push_notification' in vars(klass) and '_HANDLED_NAMESPACES' not in vars(klass)
+               for klass in cls.__mro__ if klass is not BaseDevice):
+            cls._PUSH_NAMESPACES = None
+        else:
+            cls._PUSH_NAMESPACES = frozenset(cls._PUSH_DISPATCH).union(
+                *(vars(klass).get('_HANDLED_NAMESPACES', ()) for klass in cls.__mro__))
+
     def __init__(self, device_uuid: str,
                  manager,  # TODO: type hinting "manager"
                  **kwargs):
         self._uuid = device_uuid
         self._manager = manager
-        self._channels = self._parse_channels(kwargs.get('channels', []))
+        self._parse_channels(kwargs.get('channels') or ())
 
         # Information about device
         self._name = kwargs.get('devName')
         self._type = kwargs.get('deviceType')
         self._fwversion = kwargs.get('fmwareVersion')
         self._hwversion = kwargs.get('hdwareVersion')
-        self._online = OnlineStatus(kwargs.get('onlineStatus', -1))
+        self._set_online_status(kwargs.get('onlineStatus', -1))
 
         self._abilities = {}
+        self._str_cache = None
+
+    def _set_online_status(self, status: Union[int, OnlineStatus, None]) -> None:
+        # `_is_online` mirrors `_online == OnlineStatus.ONLINE`: both are only ever set here
+        self._online = parse_online_status(status)
+        self._is_online = self._online is OnlineStatus.ONLINE
 
     @property
     def internal_id(self) -> str:
@@ -90,28 +140,62 @@ class BaseDevice(object):
         return self._online
 
     @property
-    def channels(self) -> List[ChannelInfo]:
+    def channels(self) -> Tuple[ChannelInfo, ...]:
         """
         List of channels exposed by this device. Multi-channel devices might expose a master
         switch at index 0.
         :return:
         """
+        # ChannelInfo objects are only built when somebody actually asks for them.
+        if self._channels is None:
+            self._channels = tuple(ChannelInfo(index=i,
+                                               name=name,
+                                               channel_type=channel_type,
+                                               is_master_channel=bool((self._channel_master_mask >> i) & 1))
+                                   for i, (name, channel_type) in enumerate(zip(self._channel_names,
+                                                                                self._channel_types)))
         return self._channels
 
     def update_from_http_state(self, hdevice: HttpDeviceInfo) -> None:
         # TODO: update local name/hwversion/fwversion/online-status from online http information
         # Careful with online  status: not all the devices might expose an online mixin.
+        # The cached string representation depends on name/type/hw/fw, so it must be dropped.
+        self._str_cache = None
         raise Exception("Not implemented yet!")
 
+    def handles_push_notification(self, namespace: Namespace) -> bool:
+        """
+        Tells whether this device has any handler for push notifications of the given namespace.
+        :param namespace:
+        :return:
+        """
+        return self._PUSH_NAMESPACES is None or namespace in self._PUSH_NAMESPACES
+
     def handle_push_notification(self, namespace: Namespace, data: dict) -> bool:
-        # By design, the base class does not implement any push notification.
-        _LOGGER.debug(f"MerossBaseDevice {self.name} handling notification {namespace}")
-        return False
+        # By design, the base class does not implement any push notification: it only dispatches it
+        # to the handlers registered by the mixins for that namespace.
+        _LOGGER.debug("MerossBaseDevice %s handling notification %s", self.name, namespace)
+        handlers = self._PUSH_DISPATCH.get(namespace)
+        if handlers is None:
+            return False
+
+        handled = False
+        for handler in handlers:
+            handled = handler(self, namespace, data) or handled
+        return handled
 
     def handle_update(self, namespace: Namespace, data: dict) -> bool:
-        # By design, the base class doe snot implement any update logic
+        # By design, the base class doe snot implement any update logic: it only dispatches it
+        # to the handlers registered by the mixins for that namespace.
         # TODO: we might update name/uuid/other stuff in here...
-        return False
+        handlers = self._UPDATE_DISPATCH.get(namespace)
+        if handlers is None:
+            return False
+
+        handled = False
+        for handler in handlers:
+            handled = handler(self, namespace, data) or handled
+        return handled
 
     async def async_update(self, *args, **kwargs) -> None:
         """
@@ -136,29 +220,36 @@ class BaseDevice(object):
         pass
 
     async def _execute_command(self, method: str, namespace: Namespace, payload: dict, timeout: float = 5) -> dict:
-        return await self._manager.async_execute_cmd(destination_device_uuid=self.uuid,
-                                                     method=method,
-                                                     namespace=namespace,
-                                                     payload=payload,
-                                                     timeout=timeout)
+        return await self._manager.async_execute_cmd(self._uuid, method, namespace, payload, timeout)
 
     def __str__(self) -> str:
-        basic_info = f"{self.name} ({self.type}, HW {self.hardware_version}, FW {self.firmware_version})"
+        # Name, type and versions only change upon (rare) http syncs, so the formatted string is cached.
+        basic_info = self._str_cache
+        if basic_info is None:
+            basic_info = f"{self.name} ({self.type}, HW {self.hardware_version}, FW {self.firmware_version})"
+            self._str_cache = basic_info
         return basic_info
 
-    @staticmethod
-    def _parse_channels(channel_data: List) -> List[ChannelInfo]:
-        res = []
-        if channel_data is None:
-            return res
+    def _parse_channels(self, channel_data: Sequence[dict]) -> None:
+        # Channel information is stored as parallel tuples (one per attribute) plus a name index,
+        # so that lookups do not need to scan the channel list.
+        self._channel_names = tuple(val.get('name') for val in channel_data)
+        self._channel_types = tuple(val.get('type') for val in channel_data)
+
+        # The first channel, when present, is always the master one
+        self._channel_master_mask = 1 if len(channel_data) > 0 else 0
 
-        for i, val in enumerate(channel_data):
-            name = val.get('name')
-            type = val.get('type')
-            master = i == 0
-            res.append(ChannelInfo(index=i, name=name, channel_type=type, is_master_channel=master))
+        # Names shared by multiple channels are ambiguous, so they are mapped to None
+        self._channel_by_name = {}
+        for i, name in enumerate(self._channel_names):
+            self._channel_by_name[name] = None if name in self._channel_by_name else i
 
-        return res
+        self._channels = None
+
+    def _get_channel(self, index: Optional[int]) -> ChannelInfo:
+        if index is None or index < 0 or index >= len(self._channel_names):
+            raise IndexError(index)
+        return self.channels[index]
 
     def lookup_channel(self, channel_id_or_name: Union[int, str]):
         """
@@ -166,25 +257,32 @@ class BaseDevice(object):
         :param channel_id_or_name:
         :return:
         """
-        res = []
-        if isinstance(channel_id_or_name, str):
-            res = list(filter(lambda c: c.name == channel_id_or_name, self._channels))
-        elif isinstance(channel_id_or_name, int):
-            res = list(filter(lambda c: c.index == channel_id_or_name, self._channels))
-        if len(res) == 1:
-            return res[0]
+        try:
+            if isinstance(channel_id_or_name, str):
+                return self._get_channel(self._channel_by_name[channel_id_or_name])
+            elif isinstance(channel_id_or_name, int):
+                return self._get_channel(channel_id_or_name)
+        except (KeyError, IndexError):
+            pass
         raise ValueError(f"Could not find channel by id or name = {channel_id_or_name}")
 
 
 class HubDevice(BaseDevice):
     # TODO: provide meaningful comment here describing what this class does
     #  Discvoery?? Bind/unbind?? Online??
+    __slots__ = ('_sub_devices', '_sub_devices_tuple', '_subdevice_updates')
+
     def __init__(self, device_uuid: str, manager, **kwargs):
         super().__init__(device_uuid, manager, **kwargs)
         self._sub_devices = {}
+        # Snapshot of the registered subdevices, rebuilt upon registration, so that iterating over them
+        # does not need to walk the dictionary
+        self._sub_devices_tuple = ()
+        # Batched update tasks currently in flight, by subdevice id
+        self._subdevice_updates = {}
 
     def get_subdevices(self) -> Iterable[GenericSubDevice]:
-        return self._sub_devices.values()
+        return self._sub_devices_tuple
 
     def get_subdevice(self, subdevice_id: str) -> Optional[GenericSubDevice]:
         return self._sub_devices.get(subdevice_id)
@@ -196,9 +294,94 @@ class HubDevice(BaseDevice):
             return
 
         self._sub_devices[subdevice.subdevice_id] = subdevice
+        self._sub_devices_tuple = tuple(self._sub_devices.values())
+
+    async def async_update_subdevices(self, subdevice_ids: Optional[Iterable[str]] = None) -> None:
+        """
+        Refreshes the state of the given subdevices by issuing a single GET-ALL command for every kind of
+        subdevice involved, rather than one command per subdevice.
+        Subdevices whose `async_update` is invoked while this update is in progress wait for its result
+        instead of sending their own command.
+
+        :param subdevice_ids: ids of the subdevices to update. When None, all the registered subdevices are updated.
+
+        :return: None
+        """
+        if subdevice_ids is None:
+            subdevices = self._sub_devices_tuple
+        else:
+            subdevices = []
+            for subdevice_id in subdevice_ids:
+                subdevice = self._sub_devices.get(subdevice_id)
+                if subdevice is None:
+                    _LOGGER.warning("Subdevice %s has not been registered with this hub (%s). It won't be updated.",
+                                    subdevice_id, self.name)
+                    continue
+                subdevices.append(subdevice)
+
+        # Different kinds of subdevices are updated via different namespaces
+        ids_by_namespace = {}
+        for subdevice in subdevices:
+            if subdevice._UPDATE_ALL_NAMESPACE is None:
+                _LOGGER.error("Subdevice %s does not implement any GET_ALL namespace. It won't be updated.",
+                              subdevice.subdevice_id)
+                continue
+            ids_by_namespace.setdefault(subdevice._UPDATE_ALL_NAMESPACE, []).append(subdevice.subdevice_id)
+
+        await asyncio.gather(*(self._start_subdevices_update(namespace=namespace, subdevice_ids=ids)
+                               for namespace, ids in ids_by_namespace.items()))
+
+    def _start_subdevices_update(self,
+                                 namespace: Namespace,
+                                 subdevice_ids: Optional[List[str]] = None) -> asyncio.Future:
+        """
+        Schedules a single GET-ALL command on the given namespace and records it as the in-flight update of the
+        subdevices it covers.
+
+        :param namespace: GET-ALL namespace of the subdevices to update
+        :param subdevice_ids: ids of the subdevices to update. When None, the hub is asked for every subdevice
+               reporting on that namespace.
+
+        :return: the update task
+        """
+        if subdevice_ids is None:
+            payload = {'all': []}
+            covered_ids = [sd.subdevice_id for sd in self._sub_devices_tuple if sd._UPDATE_ALL_NAMESPACE is namespace]
+        else:
+            payload = {'all': [{'id': subdevice_id} for subdevice_id in subdevice_ids]}
+            covered_ids = subdevice_ids
+
+        task = asyncio.ensure_future(self._async_update_subdevices_batch(namespace=namespace,
+                                                                         payload=payload,
+                                                                         subdevice_ids=covered_ids))
+        for subdevice_id in covered_ids:
+            self._subdevice_updates[subdevice_id] = task
+        return task
+
+    async def _async_update_subdevices_batch(self, namespace: Namespace, payload: dict,
+                                             subdevice_ids: List[str]) -> None:
+        try:
+            result = await self._execute_command(method="GET", namespace=namespace, payload=payload)
+            for subdev_state in result.get('all', []):
+                subdevice_id = subdev_state['id']
+                subdevice = self._sub_devices.get(subdevice_id)
+                if subdevice is None:
+                    _LOGGER.warning("Received data for subdevice %s, which has not been registered with this hub yet. "
+                                    "This update will be ignored.", subdevice_id)
+                    continue
+                subdevice.handle_push_notification(namespace=namespace, data=subdev_state)
+        finally:
+            current = asyncio.current_task()
+            for subdevice_id in subdevice_ids:
+                if self._subdevice_updates.get(subdevice_id) is current:
+                    del self._subdevice_updates[subdevice_id]
+
+    def _get_pending_subdevice_update(self, subdevice_id: str) -> Optional[asyncio.Future]:
+        return self._subdevice_updates.get(subdevice_id)
 
 
 class GenericSubDevice(BaseDevice):
+    __slots__ = ('_subdevice_id', '_onoff', '_mode', '_temperature', '_hub')
     _UPDATE_ALL_NAMESPACE = None
 
     def __init__(self, hubdevice_uuid: str, subdevice_id: str, manager, **kwargs):
@@ -209,10 +392,9 @@ class GenericSubDevice(BaseDevice):
         self._onoff = None
         self._mode = None
         self._temperature = None
-        hub = manager.find_devices(device_uuids=(hubdevice_uuid,))
-        if len(hub) < 1:
+        self._hub = manager.get_device(hubdevice_uuid)
+        if self._hub is None:
             raise ValueError("Specified hub device is not present")
-        self._hub = hub[0]
 
     async def _execute_command(self, method: str, namespace: Namespace, payload: dict, timeout: float = 5) -> dict:
         # Every command should be invoked via HUB?
@@ -221,24 +403,29 @@ class GenericSubDevice(BaseDevice):
     async def async_update(self, *args, **kwargs) -> None:
         if self._UPDATE_ALL_NAMESPACE is None:
             _LOGGER.error("GenericSubDevice does not implement any GET_ALL namespace. Update won't be performed.")
-            pass
+            return
 
         # When dealing with hubs, we need to "intercept" the UPDATE()
         await super().async_update(*args, **kwargs)
 
+        # If the hub is already updating this subdevice as part of a batched update, wait for that one
+        # rather than issuing another command.
+        pending_update = self._hub._get_pending_subdevice_update(self._subdevice_id)
+        if pending_update is not None:
+            await asyncio.shield(pending_update)
+            return
+
         # When issuing an update-all command to the hub,
         # we need to query all sub-devices.
+        namespace = self._UPDATE_ALL_NAMESPACE
+        target_id = self._subdevice_id
         result = await self._hub._execute_command(method="GET",
-                                                  namespace=self._UPDATE_ALL_NAMESPACE,
-                                                  payload={'all': [{'id': self.subdevice_id}]})
-        subdevices_states = result.get('all')
-        for subdev_state in subdevices_states:
-            subdev_id = subdev_state.get('id')
-
-            if subdev_id != self.subdevice_id:
-                continue
-            self.handle_push_notification(namespace=self._UPDATE_ALL_NAMESPACE, data=subdev_state)
-            break
+                                                  namespace=namespace,
+                                                  payload={'all': [{'id': target_id}]})
+        subdevices_states = result.get('all', ())
+        subdev_state = next((s for s in subdevices_states if s.get('id') == target_id), None)
+        if subdev_state is not None:
+            self.handle_push_notification(namespace=namespace, data=subdev_state)
 
     @property
     def internal_id(self) -> str:
@@ -251,13 +438,16 @@ class GenericSubDevice(BaseDevice):
     @property
     def online_status(self) -> OnlineStatus:
         # If the HUB device is offline, return offline
-        if self._hub.online_status != OnlineStatus.ONLINE:
-            return self._hub.online_status
+        hub = self._hub
+        if not hub._is_online:
+            return hub._online
 
         return self._online
 
 
 class ChannelInfo(object):
+    __slots__ = ('_index', '_name', '_type', '_master')
+
     def __init__(self, index: int, name: str = None, channel_type: str = None, is_master_channel: bool = False):
         self._index = index
         self._name = name
@@ -11,6 +11,7 @@ _DATE_FORMAT = '%Y-%m-%d'
 
 
 class ConsumptionXMixin(object):
+    __slots__ = ()
     _execute_command: callable
 
     def __init__(self, device_uuid: str,
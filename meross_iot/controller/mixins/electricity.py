@@ -10,6 +10,7 @@ _DATE_FORMAT = '%Y-%m-%d'
 
 
 class ElectricityMixin(object):
+    __slots__ = ()
     _execute_command: callable
 
     def __init__(self, device_uuid: str,
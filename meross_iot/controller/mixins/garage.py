@@ -5,8 +5,15 @@ from meross_iot.model.enums import Namespace
 
 _LOGGER = logging.getLogger(__name__)
 
+# Enum members resolved once, rather than on every command
+_NS_GARAGE = Namespace.GARAGE_DOOR_STATE
+
 
 class GarageOpenerMixin:
+    __slots__ = ()
+    _MIXIN_SLOTS = ('_door_open_mask', '_door_known_mask', '_garage_payload')
+    _PUSH_HANDLERS = {Namespace.GARAGE_DOOR_STATE: '_handle_garage_door_push'}
+    _UPDATE_HANDLERS = {Namespace.SYSTEM_ALL: '_handle_garage_door_update'}
     _execute_command: callable
     _abilities_spec: dict
     uuid: str
@@ -15,46 +22,48 @@ class GarageOpenerMixin:
                  manager,
                  **kwargs):
         super().__init__(device_uuid=device_uuid, manager=manager, **kwargs)
-        self._door_open_state_by_channel = {}
 
-    def handle_push_notification(self, namespace: Namespace, data: dict) -> bool:
-        locally_handled = False
+        # Door states are packed into two bitmasks, one bit per channel: the first one tells whether
+        # the door is open, the second one whether its state is known at all.
+        self._door_open_mask = 0
+        self._door_known_mask = 0
+
+        # Pre-built command payload: only channel and open fields change between door operations
+        self._garage_payload = {"state": {"channel": 0, "open": 0, "uuid": self.uuid}}
 
-        if namespace == Namespace.GARAGE_DOOR_STATE:
-            _LOGGER.debug(f"{self.__class__.__name__} handling push notification for namespace "
-                          f"{namespace}")
-            payload = data.get('state')
-            if payload is None:
-                _LOGGER.error(f"{self.__class__.__name__} could not find 'state' attribute in push notification data: "
-                              f"{data}")
-                locally_handled = False
-            else:
-                # The door opener state push notification contains an object for every channel handled by the
-                # device
-                for door in payload:
-                    channel_index = door['channel']
-                    state = door['open'] == 1
-                    self._door_open_state_by_channel[channel_index] = state
-                    locally_handled = True
-
-        # Always call the parent handler when done with local specific logic. This gives the opportunity to all
-        # ancestors to catch all events.
-        parent_handled = super().handle_push_notification(namespace=namespace, data=data)
-        return locally_handled or parent_handled
-
-    def handle_update(self, namespace: Namespace, data: dict) -> bool:
-        _LOGGER.debug(f"Handling {self.__class__.__name__} mixin data update.")
+    def _handle_garage_door_push(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("%s handling push notification for namespace %s", self.__class__.__name__, namespace)
+        payload = data.get('state')
+        if payload is None:
+            _LOGGER.error(f"{self.__class__.__name__} could not find 'state' attribute in push notification data: "
+                          f"{data}")
+            return False
+
+        # The door opener state push notification contains an object for every channel handled by the
+        # device
         locally_handled = False
-        if namespace == Namespace.SYSTEM_ALL:
-            doors_data = data.get('all', {}).get('digest', {}).get('garageDoor', [])
-            for door in doors_data:
-                channel_index = door['channel']
-                state = door['open'] == 1
-                self._door_open_state_by_channel[channel_index] = state
+        for door in payload:
+            self._update_door_state(channel=door['channel'], is_open=door['open'] == 1)
             locally_handled = True
-
-        super_handled = super().handle_update(namespace=namespace, data=data)
-        return super_handled or locally_handled
+        return locally_handled
+
+    def _handle_garage_door_update(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("Handling %s mixin data update.", self.__class__.__name__)
+        try:
+            doors_data = data['all']['digest']['garageDoor']
+        except (KeyError, TypeError):
+            doors_data = ()
+        for door in doors_data:
+            self._update_door_state(channel=door['channel'], is_open=door['open'] == 1)
+        return True
+
+    def _update_door_state(self, channel: int, is_open: bool) -> None:
+        bit = 1 << channel
+        self._door_known_mask |= bit
+        if is_open:
+            self._door_open_mask |= bit
+        else:
+            self._door_open_mask &= ~bit
 
     async def open(self, channel: int = 0, *args, **kwargs) -> None:
         """
@@ -77,8 +86,11 @@ class GarageOpenerMixin:
         await self._operate(state=False, channel=channel, *args, **kwargs)
 
     async def _operate(self, state: bool, channel: int = 0, *args, **kwargs) -> None:
-        payload = {"state": {"channel": channel, "open": 1 if state else 0, "uuid": self.uuid}}
-        await self._execute_command(method="SET", namespace=Namespace.GARAGE_DOOR_STATE, payload=payload)
+        # Reusing the payload template is safe: see MerossManager.async_execute_cmd
+        inner = self._garage_payload["state"]
+        inner["channel"] = channel
+        inner["open"] = int(state)
+        await self._execute_command(method="SET", namespace=_NS_GARAGE, payload=self._garage_payload)
 
     def is_open(self, channel: int = 0, *args, **kwargs) -> Optional[bool]:
         """
@@ -88,4 +100,6 @@ class GarageOpenerMixin:
 
         :return: False if the door is closed, True otherwise
         """
-        return self._door_open_state_by_channel.get(channel)
+        if not (self._door_known_mask >> channel) & 1:
+            return None
+        return bool((self._door_open_mask >> channel) & 1)
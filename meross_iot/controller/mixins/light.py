@@ -13,6 +13,10 @@ class LightMixin(object):
     """
     Mixin class that enables light control.
     """
+    __slots__ = ()
+    _MIXIN_SLOTS = ('_channel_light_status',)
+    _PUSH_HANDLERS = {Namespace.CONTROL_LIGHT: '_handle_light_push'}
+    _UPDATE_HANDLERS = {Namespace.SYSTEM_ALL: '_handle_light_update'}
     _execute_command: callable
     _abilities_spec: dict
     handle_update: callable
@@ -25,43 +29,31 @@ class LightMixin(object):
         # Dictionary keeping the status for every channel
         self._channel_light_status = {}
 
-    def handle_push_notification(self, namespace: Namespace, data: dict) -> bool:
-        locally_handled = False
-
-        if namespace == Namespace.CONTROL_LIGHT:
-            _LOGGER.debug(f"{self.__class__.__name__} handling push notification for namespace {namespace}")
-            payload = data.get('light')
-            if payload is None:
-                _LOGGER.error(f"{self.__class__.__name__} could not find 'light' attribute in push notification data: "
-                              f"{data}")
-                locally_handled = False
-            else:
-                # Update the status of every channel that has been reported in this push
-                # notification.
-                c = payload['channel']
-                self._update_channel_status(channel=c,
-                                            rgb=payload.get('rgb'),
-                                            luminance=payload.get('luminance'),
-                                            temperature=payload.get('temperature'))
-                locally_handled = True
-
-        # Always call the parent handler when done with local specific logic. This gives the opportunity to all
-        # ancestors to catch all events.
-        parent_handled = super().handle_push_notification(namespace=namespace, data=data)
-        return locally_handled or parent_handled
-
-    def handle_update(self, namespace: Namespace, data: dict) -> bool:
-        _LOGGER.debug(f"Handling {self.__class__.__name__} mixin data update.")
-        locally_handled = False
-        if namespace == Namespace.SYSTEM_ALL:
-            light_data = data.get('all', {}).get('digest', {}).get('light', [])
-            self._update_channel_status(channel=light_data.get('channel'),
-                                        rgb=light_data.get('rgb'),
-                                        luminance=light_data.get('luminance'),
-                                        temperature=light_data.get('temperature'))
-            locally_handled = True
-        super_handled = super().handle_update(namespace=namespace, data=data)
-        return super_handled or locally_handled
+    def _handle_light_push(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("%s handling push notification for namespace %s", self.__class__.__name__, namespace)
+        payload = data.get('light')
+        if payload is None:
+            _LOGGER.error(f"{self.__class__.__name__} could not find 'light' attribute in push notification data: "
+                          f"{data}")
+            return False
+
+        # Update the status of every channel that has been reported in this push
+        # notification.
+        c = payload['channel']
+        self._update_channel_status(channel=c,
+                                    rgb=payload.get('rgb'),
+                                    luminance=payload.get('luminance'),
+                                    temperature=payload.get('temperature'))
+        return True
+
+    def _handle_light_update(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("Handling %s mixin data update.", self.__class__.__name__)
+        light_data = data.get('all', {}).get('digest', {}).get('light', [])
+        self._update_channel_status(channel=light_data.get('channel'),
+                                    rgb=light_data.get('rgb'),
+                                    luminance=light_data.get('luminance'),
+                                    temperature=light_data.get('temperature'))
+        return True
 
     def _supports_mode(self, mode: LightMode, channel: int = 0) -> bool:
         capacity = self._abilities_spec.get(Namespace.CONTROL_LIGHT.value).get('capacity')
@@ -7,6 +7,10 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class SprayMixin(object):
+    __slots__ = ()
+    _MIXIN_SLOTS = ('_channel_spray_status',)
+    _PUSH_HANDLERS = {Namespace.CONTROL_SPRAY: '_handle_spray_push'}
+    _UPDATE_HANDLERS = {Namespace.SYSTEM_ALL: '_handle_spray_update'}
     _execute_command: callable
     _abilities_spec: dict
     handle_update: callable
@@ -19,49 +23,35 @@ class SprayMixin(object):
         # Dictionary keeping the status for every channel
         self._channel_spray_status = {}
 
-    def handle_push_notification(self, namespace: Namespace, data: dict) -> bool:
-        locally_handled = False
-
-        if namespace == Namespace.CONTROL_SPRAY:
-            _LOGGER.debug(f"{self.__class__.__name__} handling push notification for namespace {namespace}")
-            payload = data.get('spray')
-            if payload is None:
-                _LOGGER.error(f"{self.__class__.__name__} could not find 'spray' attribute in push notification data: "
-                              f"{data}")
-                locally_handled = False
-            else:
-                # Update the status of every channel that has been reported in this push
-                # notification.
-                for c in payload:
-                    channel = c['channel']
-                    strmode = c['mode']
-                    mode = SprayMode(strmode)
-                    self._channel_spray_status[channel] = mode
-
-                locally_handled = True
-
-        # Always call the parent handler when done with local specific logic. This gives the opportunity to all
-        # ancestors to catch all events.
-        parent_handled = super().handle_push_notification(namespace=namespace, data=data)
-        return locally_handled or parent_handled
+    def _handle_spray_push(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("%s handling push notification for namespace %s", self.__class__.__name__, namespace)
+        payload = data.get('spray')
+        if payload is None:
+            _LOGGER.error(f"{self.__class__.__name__} could not find 'spray' attribute in push notification data: "
+                          f"{data}")
+            return False
+
+        # Update the status of every channel that has been reported in this push
+        # notification.
+        for c in payload:
+            channel = c['channel']
+            strmode = c['mode']
+            mode = SprayMode(strmode)
+            self._channel_spray_status[channel] = mode
+        return True
 
     def get_current_mode(self, channel: int = 0, *args, **kwargs) -> Optional[SprayMode]:
         return self._channel_spray_status.get(channel)
 
-    def handle_update(self, namespace: Namespace, data: dict) -> bool:
-        _LOGGER.debug(f"Handling {self.__class__.__name__} mixin data update.")
-        locally_handled = False
-        if namespace == Namespace.SYSTEM_ALL:
-            spray_data = data.get('all', {}).get('digest', {}).get('spray', [])
-            for c in spray_data:
-                channel = c['channel']
-                strmode = c['mode']
-                mode = SprayMode(strmode)
-                self._channel_spray_status[channel] = mode
-            locally_handled = True
-
-        super_handled = super().handle_update(namespace=namespace, data=data)
-        return super_handled or locally_handled
+    def _handle_spray_update(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("Handling %s mixin data update.", self.__class__.__name__)
+        spray_data = data.get('all', {}).get('digest', {}).get('spray', [])
+        for c in spray_data:
+            channel = c['channel']
+            strmode = c['mode']
+            mode = SprayMode(strmode)
+            self._channel_spray_status[channel] = mode
+        return True
 
     async def async_set_mode(self, mode: SprayMode, channel: int = 0, *args, **kwargs) -> None:
         payload = {'spray': {'channel': channel, 'mode': mode.value}}
@@ -1,11 +1,15 @@
 import logging
 
-from meross_iot.model.enums import Namespace, OnlineStatus
+from meross_iot.model.enums import Namespace
 
 _LOGGER = logging.getLogger(__name__)
 
+# Enum members resolved once, rather than on every update
+_NS_SYS_ALL = Namespace.SYSTEM_ALL
+
 
 class SystemAllMixin(object):
+    __slots__ = ()
     _execute_command: callable
     _abilities_spec: dict
     handle_update: callable
@@ -19,15 +23,18 @@ class SystemAllMixin(object):
         # Call the super implementation
         await super().async_update(*args, **kwargs)
 
-        result = await self._execute_command(method="GET", namespace=Namespace.SYSTEM_ALL, payload={})
+        result = await self._execute_command("GET", _NS_SYS_ALL, {})
 
         # Once we have the response, update all the mixin which are interested
-        self.handle_update(namespace=Namespace.SYSTEM_ALL, data=result)
+        self.handle_update(_NS_SYS_ALL, result)
 
 
 class SystemOnlineMixin(object):
+    __slots__ = ()
+    _PUSH_HANDLERS = {Namespace.SYSTEM_ONLINE: '_handle_online_push'}
+    _UPDATE_HANDLERS = {Namespace.SYSTEM_ALL: '_handle_online_update'}
     _abilities_spec: dict
-    _online: OnlineStatus
+    _set_online_status: callable
     handle_update: callable
 
     def __init__(self, device_uuid: str,
@@ -35,35 +42,24 @@ class SystemOnlineMixin(object):
                  **kwargs):
         super().__init__(device_uuid=device_uuid, manager=manager, **kwargs)
 
-    def handle_update(self, namespace: Namespace, data: dict) -> bool:
-        _LOGGER.debug(f"Handling {self.__class__.__name__} mixin data update.")
-        locally_handled = False
-        if namespace == Namespace.SYSTEM_ALL:
-            online_data = data.get('all').get('system').get('online')
-            status = OnlineStatus(online_data.get("status"))
-            self._online = status
-            locally_handled = True
-
-        super_handled = super().handle_update(namespace=namespace, data=data)
-        return super_handled or locally_handled
-
-    def handle_push_notification(self, namespace: Namespace, data: dict) -> bool:
-        locally_handled = False
-
-        if namespace == Namespace.SYSTEM_ONLINE:
-            _LOGGER.debug(f"OnlineMixin handling push notification for namespace {namespace}")
-            payload = data.get('online')
-            if payload is None:
-                _LOGGER.error(f"OnlineMixin could not find 'online' attribute in push notification data: "
-                              f"{data}")
-                locally_handled = False
-            else:
-                online_data = payload.get("online")
-                status = OnlineStatus(online_data.get("status"))
-                self._online = status
-                locally_handled = True
-
-        # Always call the parent handler when done with local specific logic. This gives the opportunity to all
-        # ancestors to catch all events.
-        parent_handled = super().handle_push_notification(namespace=namespace, data=data)
-        return locally_handled or parent_handled
+    def _handle_online_update(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("Handling %s mixin data update.", self.__class__.__name__)
+        try:
+            online_data = data['all']['system']['online']
+        except (KeyError, TypeError):
+            _LOGGER.error("%s could not find online information in update data: %s", self.__class__.__name__, data)
+            return False
+        self._set_online_status(online_data.get("status"))
+        return True
+
+    def _handle_online_push(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("OnlineMixin handling push notification for namespace %s", namespace)
+        payload = data.get('online')
+        if payload is None:
+            _LOGGER.error(f"OnlineMixin could not find 'online' attribute in push notification data: "
+                          f"{data}")
+            return False
+
+        online_data = payload.get("online")
+        self._set_online_status(online_data.get("status"))
+        return True
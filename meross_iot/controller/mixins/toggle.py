@@ -11,6 +11,10 @@ class ToggleXMixin(object):
     This mixin is implemented by devices that support ToggleX operation, such as smart switches
     and smart bulbs.
     """
+    __slots__ = ()
+    _MIXIN_SLOTS = ('_channel_togglex_status',)
+    _PUSH_HANDLERS = {Namespace.CONTROL_TOGGLEX: '_handle_togglex_push'}
+    _UPDATE_HANDLERS = {Namespace.SYSTEM_ALL: '_handle_togglex_update'}
     _execute_command: callable
     handle_update: callable
 
@@ -22,48 +26,39 @@ class ToggleXMixin(object):
         # _channel_status is a dictionary keeping the status for every channel
         self._channel_togglex_status = {}
 
-    def handle_push_notification(self, namespace: Namespace, data: dict) -> bool:
-        locally_handled = False
-
-        if namespace == Namespace.CONTROL_TOGGLEX:
-            _LOGGER.debug(f"{self.__class__.__name__} handling push notification for namespace {namespace}")
-            payload = data.get('togglex')
-            if payload is None:
-                _LOGGER.error(f"{self.__class__.__name__} could not find 'togglex' attribute in push notification data: {data}")
-
-            # The content of the togglex payload may vary. It can either be a dict (plugs with single switch)
-            # or a list (power strips).
-            elif isinstance(payload, list):
-                for c in payload:
-                    channel = c['channel']
-                    switch_state = c['onoff'] == 1
-                    self._channel_togglex_status[channel] = switch_state
-                    locally_handled = True
-
-            elif isinstance(payload, dict):
-                channel = payload['channel']
-                switch_state = payload['onoff'] == 1
-                self._channel_togglex_status[channel] = switch_state
-                locally_handled = True
-
-        # Always call the parent handler when done with local specific logic. This gives the opportunity to all
-        # ancestors to catch all events.
-        parent_handled = super().handle_push_notification(namespace=namespace, data=data)
-        return locally_handled or parent_handled
+    def _handle_togglex_push(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("%s handling push notification for namespace %s", self.__class__.__name__, namespace)
+        payload = data.get('togglex')
+        if payload is None:
+            _LOGGER.error(f"{self.__class__.__name__} could not find 'togglex' attribute in push notification data: {data}")
+            return False
 
-    def handle_update(self, namespace: Namespace, data: dict) -> bool:
-        _LOGGER.debug(f"Handling {self.__class__.__name__} mixin data update.")
+        # The content of the togglex payload may vary. It can either be a dict (plugs with single switch)
+        # or a list (power strips).
         locally_handled = False
-        if namespace == Namespace.SYSTEM_ALL:
-            payload = data.get('all', {}).get('digest', {}).get('togglex', [])
+        if isinstance(payload, list):
             for c in payload:
                 channel = c['channel']
                 switch_state = c['onoff'] == 1
                 self._channel_togglex_status[channel] = switch_state
+                locally_handled = True
+
+        elif isinstance(payload, dict):
+            channel = payload['channel']
+            switch_state = payload['onoff'] == 1
+            self._channel_togglex_status[channel] = switch_state
             locally_handled = True
 
-        super_handled = super().handle_update(namespace=namespace, data=data)
-        return super_handled or locally_handled
+        return locally_handled
+
+    def _handle_togglex_update(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("Handling %s mixin data update.", self.__class__.__name__)
+        payload = data.get('all', {}).get('digest', {}).get('togglex', [])
+        for c in payload:
+            channel = c['channel']
+            switch_state = c['onoff'] == 1
+            self._channel_togglex_status[channel] = switch_state
+        return True
 
     def is_on(self, channel=0, *args, **kwargs) -> Optional[bool]:
         """
@@ -115,6 +110,10 @@ class ToggleXMixin(object):
 
 
 class ToggleMixin(object):
+    __slots__ = ()
+    _MIXIN_SLOTS = ('_channel_toggle_status',)
+    _PUSH_HANDLERS = {Namespace.CONTROL_TOGGLEX: '_handle_toggle_push'}
+    _UPDATE_HANDLERS = {Namespace.SYSTEM_ALL: '_handle_toggle_update'}
     _execute_command: callable
     handle_update: callable
 
@@ -126,36 +125,25 @@ class ToggleMixin(object):
         # _channel_status is a dictionary keeping the status for every channel
         self._channel_toggle_status = {}
 
-    def handle_push_notification(self, namespace: Namespace, data: dict) -> bool:
-        locally_handled = False
-
-        if namespace == Namespace.CONTROL_TOGGLEX:
-            _LOGGER.debug(f"ToggleMixin handling push notification for namespace {namespace}")
-            payload = data.get('togglex')
-            if payload is None:
-                _LOGGER.error(f"ToggleMixin could not find 'toggle' attribute in push notification data: {data}")
-            else:
-                channel_index = payload.get('channel', 0)
-                switch_state = payload['onoff'] == 1
-                self._channel_toggle_status[channel_index] = switch_state
-                locally_handled = True
-
-        # Always call the parent handler when done with local specific logic. This gives the opportunity to all
-        # ancestors to catch all events.
-        parent_handled = super().handle_push_notification(namespace=namespace, data=data)
-        return locally_handled or parent_handled
-
-    def handle_update(self, namespace: Namespace, data: dict) -> bool:
-        _LOGGER.debug(f"Handling {self.__class__.__name__} mixin data update.")
-        locally_handled = False
-        if namespace == Namespace.SYSTEM_ALL:
-            payload = data.get('all', {}).get('control', {}).get('toggle', {})
-            channel_index = payload.get('channel', 0)
-            switch_state = payload['onoff'] == 1
-            self._channel_toggle_status[channel_index] = switch_state
-            locally_handled = True
-        super_handled = super().handle_update(namespace=namespace, data=data)
-        return super_handled or locally_handled
+    def _handle_toggle_push(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("ToggleMixin handling push notification for namespace %s", namespace)
+        payload = data.get('togglex')
+        if payload is None:
+            _LOGGER.error(f"ToggleMixin could not find 'toggle' attribute in push notification data: {data}")
+            return False
+
+        channel_index = payload.get('channel', 0)
+        switch_state = payload['onoff'] == 1
+        self._channel_toggle_status[channel_index] = switch_state
+        return True
+
+    def _handle_toggle_update(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("Handling %s mixin data update.", self.__class__.__name__)
+        payload = data.get('all', {}).get('control', {}).get('toggle', {})
+        channel_index = payload.get('channel', 0)
+        switch_state = payload['onoff'] == 1
+        self._channel_toggle_status[channel_index] = switch_state
+        return True
 
     def is_on(self, channel=0, *args, **kwargs) -> Optional[bool]:
         return self._channel_toggle_status.get(channel, None)
@@ -1,13 +1,43 @@
 import logging
-from collections import deque
 from datetime import datetime
-from typing import Optional, Iterable
+from typing import Optional, Iterable, List
 
 from meross_iot.controller.device import GenericSubDevice
-from meross_iot.model.enums import Namespace, OnlineStatus, ThermostatV3Mode
+from meross_iot.model.enums import Namespace, ThermostatV3Mode
+from meross_iot.utilities.conversion import utc_naive_from_timestamp
 
 _LOGGER = logging.getLogger(__name__)
 
+# Enum members resolved once, rather than on every command
+_NS_HUB_TOGGLEX = Namespace.HUB_TOGGLEX
+_NS_HUB_MTS100_MODE = Namespace.HUB_MTS100_MODE
+_NS_HUB_MTS100_TEMPERATURE = Namespace.HUB_MTS100_TEMPERATURE
+
+# Column-wise (temperature, humidity, from_ts, to_ts) representation of "no samples"
+_NO_SAMPLES = ((), (), (), ())
+
+# Value -> member table, so that received valve modes do not go through the Enum value lookup
+_THERMOSTAT_MODE_BY_VALUE = {mode.value: mode for mode in ThermostatV3Mode}
+
+
+def _from_decimals(value) -> Optional[float]:
+    # Temperatures and humidity are reported by the API in tenths of unit
+    return None if value is None else float(value) / 10.0
+
+
+# Mts100 temperature attributes reported in decimals by the API, with the slot each one is stored into
+_MTS100_SCALED_TEMPERATURE_SLOTS = {
+    'room': '_temp_room',
+    'currentSet': '_temp_current_set',
+    'min': '_temp_min',
+    'max': '_temp_max'
+}
+# Mts100 temperature attributes reported as 0/1 flags, stored as booleans
+_MTS100_FLAG_TEMPERATURE_SLOTS = {
+    'heating': '_temp_heating',
+    'openWindow': '_temp_open_window'
+}
+
 
 class Ms100Sensor(GenericSubDevice):
     """
@@ -15,66 +45,79 @@ class Ms100Sensor(GenericSubDevice):
     The MS100 offers temperature and humidity sensing.
     Moreover, this device is capable of triggering settable alerts.
     """
+    __slots__ = ('_temp_latest', '_temp_sample_time', '_temp_min', '_temp_max', '_hum_latest', '_samples',
+                 '_last_sampled_time_cache')
     _UPDATE_ALL_NAMESPACE = Namespace.HUB_SENSOR_ALL
+    _PUSH_HANDLERS = {
+        Namespace.HUB_ONLINE: '_handle_online_push',
+        Namespace.HUB_SENSOR_ALL: '_handle_all_push',
+        Namespace.HUB_SENSOR_TEMPHUM: '_handle_temphum_push',
+        Namespace.HUB_SENSOR_ALERT: '_handle_alert_push'
+    }
 
     def __init__(self, hubdevice_uuid: str, subdevice_id: str, manager, **kwargs):
         super().__init__(hubdevice_uuid, subdevice_id, manager, **kwargs)
-        self.__temperature = {}
-        self.__humidity = {}
-        self.__samples = []
+        # Latest sampled values are stored already converted from the API decimals, so that reads are plain loads
+        self._temp_latest = None
+        self._temp_sample_time = None
+        self._temp_min = None
+        self._temp_max = None
+        self._hum_latest = None
+        # Samples are kept column-wise, as raw values (temperature, humidity, from_ts, to_ts):
+        # the per-sample dicts are only built when read.
+        self._samples = _NO_SAMPLES
+        # (raw timestamp, datetime) pair of the last converted sampling time
+        self._last_sampled_time_cache = (None, None)
 
     async def _execute_command(self, method: str, namespace: Namespace, payload: dict, timeout: float = 5) -> dict:
         raise NotImplementedError("This method should never be called directly for subdevices.")
 
-    def __prepare_push_notification_data(self, data: dict):
-        update_element = data.copy()
-        del update_element['id']
-        return update_element
-
-    def handle_push_notification(self, namespace: Namespace, data: dict) -> bool:
-        locally_handled = False
-        if namespace == Namespace.HUB_ONLINE:
-            update_element = self.__prepare_push_notification_data(data=data)
-            self._online = OnlineStatus(update_element.get('status', -1))
-            locally_handled = True
-        elif namespace == Namespace.HUB_SENSOR_ALL:
-            self._online = OnlineStatus(data.get('online', {}).get('status', -1))
-            self.__temperature.update(data.get('temperature', {}))
-            self.__humidity.update(data.get('humidity', {}))
-            locally_handled = True
-        elif namespace == Namespace.HUB_SENSOR_TEMPHUM:
-            latest_temperature = data.get('latestTemperature')
-            latest_humidity = data.get('latestHumidity')
-            synced_time = data.get('syncedTime')
-            samples = data.get('sample')
-            if synced_time is not None and (self.last_sampled_time is None or
-                                             synced_time > self.last_sampled_time.timestamp()):
-                self.__temperature['latestSampleTime'] = synced_time
-                self.__temperature['latest'] = latest_temperature
-                self.__humidity['latestSampleTime'] = synced_time
-                self.__humidity['latest'] = latest_humidity
-
-            self.__samples.clear()
-            for sample in samples:
-                temp, hum, from_ts, to_ts, unknown = sample
-                self.__samples.append({
-                    'from_ts': from_ts,
-                    'to_ts': to_ts,
-                    'temperature': float(temp)/10,
-                    'humidity': float(hum)/10
-                })
-
+    def _handle_online_push(self, namespace: Namespace, data: dict) -> bool:
+        self._set_online_status(data.get('status', -1))
+        return True
+
+    def _handle_all_push(self, namespace: Namespace, data: dict) -> bool:
+        self._set_online_status(data.get('online', {}).get('status', -1))
+
+        # Only the attributes reported by the notification are updated
+        temperature = data.get('temperature')
+        if temperature is not None:
+            if 'latest' in temperature:
+                self._temp_latest = _from_decimals(temperature['latest'])
+            if 'latestSampleTime' in temperature:
+                self._temp_sample_time = temperature['latestSampleTime']
+            if 'min' in temperature:
+                self._temp_min = temperature['min']
+            if 'max' in temperature:
+                self._temp_max = temperature['max']
+        humidity = data.get('humidity')
+        if humidity is not None and 'latest' in humidity:
+            self._hum_latest = _from_decimals(humidity['latest'])
+        return True
+
+    def _handle_temphum_push(self, namespace: Namespace, data: dict) -> bool:
+        latest_temperature = data.get('latestTemperature')
+        latest_humidity = data.get('latestHumidity')
+        synced_time = data.get('syncedTime')
+        samples = data.get('sample')
+        last_synced_time = self._temp_sample_time
+        if synced_time is not None and (last_synced_time is None or synced_time > last_synced_time):
+            self._temp_sample_time = synced_time
+            self._temp_latest = _from_decimals(latest_temperature)
+            self._hum_latest = _from_decimals(latest_humidity)
+
+            # Each sample is a (temperature, humidity, from_ts, to_ts, unknown) list
+            if samples:
+                self._samples = tuple(zip(*samples))[:4]
             else:
-                _LOGGER.debug("Skipping temperature update as synched time is None or old compared to the latest data")
-            locally_handled = True
-        elif namespace == Namespace.HUB_SENSOR_ALERT:
-            raise NotImplementedError("TODO")
-            locally_handled = True
+                self._samples = _NO_SAMPLES
+        else:
+            _LOGGER.debug("Skipping temperature update as synched time is None or old compared to the latest data")
+        return True
 
-        # Always call the parent handler when done with local specific logic. This gives the opportunity to all
-        # ancestors to catch all events.
-        parent_handled = super().handle_push_notification(namespace=namespace, data=data)
-        return locally_handled or parent_handled
+    def _handle_alert_push(self, namespace: Namespace, data: dict) -> bool:
+        _LOGGER.debug("HUB_SENSOR_ALERT push notifications are not implemented yet: ignoring it.")
+        return False
 
     @property
     def last_sampled_temperature(self) -> Optional[float]:
@@ -85,10 +128,7 @@ class Ms100Sensor(GenericSubDevice):
 
         :return: The latest sampled temperature, if available, in Celsius degree
         """
-        temp = self.__temperature.get('latest')
-        if temp is None:
-            return None
-        return float(temp) / 10.0
+        return self._temp_latest
 
     @property
     def last_sampled_humidity(self) -> Optional[float]:
@@ -99,10 +139,7 @@ class Ms100Sensor(GenericSubDevice):
 
         :return: The latest sampled humidity grade in %, if available
         """
-        humidity = self.__humidity.get('latest')
-        if humidity is None:
-            return None
-        return float(humidity) / 10.0
+        return self._hum_latest
 
     @property
     def last_sampled_time(self) -> Optional[datetime]:
@@ -111,11 +148,31 @@ class Ms100Sensor(GenericSubDevice):
 
         :return: latest sampling time in UTC, if available
         """
-        timestamp = self.__temperature.get('latestSampleTime')
+        timestamp = self._temp_sample_time
         if timestamp is None:
             return None
 
-        return datetime.utcfromtimestamp(timestamp)
+        cached_timestamp, cached_time = self._last_sampled_time_cache
+        if timestamp != cached_timestamp:
+            cached_time = utc_naive_from_timestamp(timestamp)
+            self._last_sampled_time_cache = (timestamp, cached_time)
+        return cached_time
+
+    @property
+    def samples(self) -> List[dict]:
+        """
+        Temperature and humidity samples reported along with the latest sampled values.
+
+        :return: a list of dicts, containing from_ts, to_ts, temperature (Celsius) and humidity (%)
+        """
+        # Raw samples are integers: true division already yields floats, without any float() coercion
+        temperatures, humidities, from_ts, to_ts = self._samples
+        return [{
+            'from_ts': f,
+            'to_ts': t,
+            'temperature': temp / 10,
+            'humidity': hum / 10
+        } for temp, hum, f, t in zip(temperatures, humidities, from_ts, to_ts)]
 
     @property
     def min_supported_temperature(self) -> Optional[float]:
@@ -124,83 +181,121 @@ class Ms100Sensor(GenericSubDevice):
 
         :return: float value, maximum supported temperature, if available
         """
-        return self.__temperature.get('min')
+        return self._temp_min
 
     @property
     def max_supported_temperature(self) -> Optional[float]:
         """
         Minimum supported temperature that this device can report
         """
-        return self.__temperature.get('max')
+        return self._temp_max
 
 
 class Mts100v3Valve(GenericSubDevice):
+    __slots__ = ('_is_on', '_time_sync', '_thermostat_mode', '_temp_room', '_temp_current_set', '_temp_min',
+                 '_temp_max', '_temp_heating', '_temp_open_window', '_temp_presets', '_togglex_payload',
+                 '_schedule_b_mode', '_last_active_time')
     _UPDATE_ALL_NAMESPACE = Namespace.HUB_MTS100_ALL
+    _PUSH_HANDLERS = {
+        Namespace.HUB_ONLINE: '_handle_online_push',
+        Namespace.HUB_MTS100_ALL: '_handle_all_push',
+        Namespace.HUB_TOGGLEX: '_handle_togglex_push',
+        Namespace.HUB_MTS100_MODE: '_handle_mode_push',
+        Namespace.HUB_MTS100_TEMPERATURE: '_handle_temperature_push'
+    }
+
+    # The tuple keeps the order exposed by get_supported_presets(), the frozenset serves membership checks
+    _SUPPORTED_PRESETS_TUPLE = ('custom', 'comfort', 'economy', 'away')
+    _SUPPORTED_PRESETS = frozenset(_SUPPORTED_PRESETS_TUPLE)
 
     def __init__(self, hubdevice_uuid: str, subdevice_id: str, manager, **kwargs):
         super().__init__(hubdevice_uuid, subdevice_id, manager, **kwargs)
-        self.__togglex = {}
-        self.__timeSync = None
-        self.__mode = {}
-        self.__temperature = {}
+        # Derived values (on/off state, mode enum, flags) are computed when received, so that the
+        # properties only need to return them
+        self._is_on = False
+        self._time_sync = None
+        self._thermostat_mode = None
+        # Temperatures are stored in Celsius, converted once from the API decimals when received
+        self._temp_room = None
+        self._temp_current_set = None
+        self._temp_min = None
+        self._temp_max = None
+        self._temp_heating = False
+        self._temp_open_window = False
+        self._temp_presets = {}
+        # Pre-built togglex command payload: only the onoff field changes between commands
+        self._togglex_payload = {'togglex': [{"id": subdevice_id, "onoff": 0, "channel": 0}]}
         self._schedule_b_mode = None
         self._last_active_time = None
 
     async def _execute_command(self, method: str, namespace: Namespace, payload: dict, timeout: float = 5) -> dict:
         raise NotImplementedError("This method should never be called directly for subdevices.")
 
-    def handle_push_notification(self, namespace: Namespace, data: dict) -> bool:
-        locally_handled = False
-        if namespace == Namespace.HUB_ONLINE:
-            update_element = self.__prepare_push_notification_data(data=data)
-            self._online = OnlineStatus(update_element.get('status', -1))
-            locally_handled = True
-        elif namespace == Namespace.HUB_MTS100_ALL:
-            self._schedule_b_mode = data.get('scheduleBMode')
-            self._online = OnlineStatus(data.get('online', {}).get('status', -1))
-            self._last_active_time = data.get('online', {}).get('lastActiveTime')
-            self.__togglex.update(data.get('togglex', {}))
-            self.__timeSync = data.get('timeSync', {})
-            self.__mode.update(data.get('mode', {}))
-            self.__temperature.update(data.get('temperature', {}))
-            locally_handled = True
-        elif namespace == Namespace.HUB_TOGGLEX:
-            update_element = self.__prepare_push_notification_data(data=data)
-            self.__togglex.update(update_element)
-            locally_handled = True
-        elif namespace == Namespace.HUB_MTS100_MODE:
-            update_element = self.__prepare_push_notification_data(data=data)
-            self.__mode.update(update_element)
-            locally_handled = True
-        elif namespace == Namespace.HUB_MTS100_TEMPERATURE:
-            update_element = self.__prepare_push_notification_data(data=data)
-            self.__temperature.update(update_element)
-            locally_handled = True
-
-        # Always call the parent handler when done with local specific logic. This gives the opportunity to all
-        # ancestors to catch all events.
-        parent_handled = super().handle_push_notification(namespace=namespace, data=data)
-        return locally_handled or parent_handled
-
-    def __prepare_push_notification_data(self, data: dict):
-        update_element = data.copy()
-        del update_element['id']
-        return update_element
+    def _handle_online_push(self, namespace: Namespace, data: dict) -> bool:
+        self._set_online_status(data.get('status', -1))
+        return True
+
+    def _handle_all_push(self, namespace: Namespace, data: dict) -> bool:
+        self._schedule_b_mode = data.get('scheduleBMode')
+        self._set_online_status(data.get('online', {}).get('status', -1))
+        self._last_active_time = data.get('online', {}).get('lastActiveTime')
+        self._time_sync = data.get('timeSync', {})
+        self.__update_togglex(data.get('togglex', {}))
+        self.__update_mode(data.get('mode', {}))
+        self.__update_temperature(data.get('temperature', {}))
+        return True
+
+    def _handle_togglex_push(self, namespace: Namespace, data: dict) -> bool:
+        self.__update_togglex(data)
+        return True
+
+    def _handle_mode_push(self, namespace: Namespace, data: dict) -> bool:
+        self.__update_mode(data)
+        return True
+
+    def _handle_temperature_push(self, namespace: Namespace, data: dict) -> bool:
+        self.__update_temperature(data)
+        return True
+
+    # The following helpers only update the attributes reported by the notification
+    def __update_togglex(self, togglex: dict) -> None:
+        if 'onoff' in togglex:
+            self._is_on = togglex['onoff'] == 1
+
+    def __update_mode(self, mode: dict) -> None:
+        if 'state' in mode:
+            self._thermostat_mode = _THERMOSTAT_MODE_BY_VALUE.get(mode['state'])
+
+    def __update_temperature(self, temperature: dict) -> None:
+        for key, value in temperature.items():
+            slot = _MTS100_SCALED_TEMPERATURE_SLOTS.get(key)
+            if slot is not None:
+                setattr(self, slot, _from_decimals(value))
+            elif key in self._SUPPORTED_PRESETS:
+                self._temp_presets[key] = _from_decimals(value)
+            else:
+                slot = _MTS100_FLAG_TEMPERATURE_SLOTS.get(key)
+                if slot is not None:
+                    setattr(self, slot, value == 1)
 
     def is_on(self) -> Optional[bool]:
-        return self.__togglex.get('onoff') == 1
+        return self._is_on
 
     async def async_turn_off(self, *args, **kwargs):
-        await self._hub._execute_command("SET", Namespace.HUB_TOGGLEX, {'togglex': [{"id": self.subdevice_id,
-                                                                                     "onoff": 0, "channel": 0}]})
+        await self.__send_togglex(0)
         # Assume the command was ok, so immediately update the internal state
-        self.__togglex['onoff'] = 0
+        self._is_on = False
 
     async def async_turn_on(self, *args, **kwargs):
-        await self._hub._execute_command("SET", Namespace.HUB_TOGGLEX, {'togglex': [{"id": self.subdevice_id,
-                                                                                     "onoff": 1, "channel": 0}]})
+        await self.__send_togglex(1)
         # Assume the command was ok, so immediately update the internal state
-        self.__togglex['onoff'] = 1
+        self._is_on = True
+
+    async def __send_togglex(self, onoff: int) -> None:
+        # Reusing the payload template is safe: see MerossManager.async_execute_cmd
+        payload = self._togglex_payload
+        payload['togglex'][0]["onoff"] = onoff
+        await self._hub._execute_command("SET", _NS_HUB_TOGGLEX, payload)
 
     async def async_toggle(self, *args, **kwargs):
         if self.is_on():
@@ -215,54 +310,36 @@ class Mts100v3Valve(GenericSubDevice):
 
         :return: float number
         """
-        temp = self.__temperature.get('room')
-        if temp is not None:
-            return float(temp) / 10.0
-        else:
-            return None
+        return self._temp_room
 
     @property
     def mode(self) -> Optional[ThermostatV3Mode]:
-        m = self.__mode.get('state')
-        if m is not None:
-            return ThermostatV3Mode(m)
+        return self._thermostat_mode
 
     async def async_set_mode(self, mode: ThermostatV3Mode) -> None:
         payload = {'mode': [{'id': self.subdevice_id, 'state': mode.value}]}
-        await self._hub._execute_command(method='SET', namespace=Namespace.HUB_MTS100_MODE, payload=payload)
-        self.__mode['state'] = mode.value
+        await self._hub._execute_command(method='SET', namespace=_NS_HUB_MTS100_MODE, payload=payload)
+        self._thermostat_mode = mode
 
     @property
     def target_temperature(self) -> Optional[float]:
-        temp = self.__temperature.get('currentSet')
-        if temp is not None:
-            return float(temp) / 10.0
-        else:
-            return None
+        return self._temp_current_set
 
     @property
     def min_supported_temperature(self) -> Optional[float]:
-        temp = self.__temperature.get('min')
-        if temp is not None:
-            return float(temp) / 10.0
-        else:
-            return None
+        return self._temp_min
 
     @property
     def max_supported_temperature(self) -> Optional[float]:
-        temp = self.__temperature.get('max')
-        if temp is not None:
-            return float(temp) / 10.0
-        else:
-            return None
+        return self._temp_max
 
     @property
     def is_heating(self) -> Optional[bool]:
-        return self.__temperature.get('heating') == 1
+        return self._temp_heating
 
     @property
     def is_window_open(self) -> Optional[bool]:
-        return self.__temperature.get('openWindow') == 1
+        return self._temp_open_window
 
     def get_preset_temperature(self, preset: str) -> Optional[float]:
         """
@@ -272,21 +349,18 @@ class Mts100v3Valve(GenericSubDevice):
 
         :return: float temperature value
         """
-        if preset not in self.get_supported_presets():
+        if preset not in self._SUPPORTED_PRESETS:
             _LOGGER.error(f"Preset {preset} is not supported by this device.")
-        val = self.__temperature.get(preset)
-        if val is None:
-            return None
-        return float(val) / 10.0
+        return self._temp_presets.get(preset)
 
-    @staticmethod
-    def get_supported_presets() -> Iterable[str]:
+    @classmethod
+    def get_supported_presets(cls) -> Iterable[str]:
         """
         Returns the supported presets of this device.
 
         :return: an iterable of strings
         """
-        return 'custom', 'comfort', 'economy', 'away'
+        return cls._SUPPORTED_PRESETS_TUPLE
 
     async def async_set_preset_temperature(self, preset: str, temperature: float) -> None:
         """
@@ -297,25 +371,25 @@ class Mts100v3Valve(GenericSubDevice):
 
         :return: None
         """
-        if preset not in self.get_supported_presets():
+        if preset not in self._SUPPORTED_PRESETS:
             raise ValueError(f"Preset {preset} is not supported by this device. "
                              f"Valid presets are: {self.get_supported_presets()}")
         target_temp = temperature * 10
-        await self._hub._execute_command(method="SET", namespace=Namespace.HUB_MTS100_TEMPERATURE, payload={
+        await self._hub._execute_command(method="SET", namespace=_NS_HUB_MTS100_TEMPERATURE, payload={
             'temperature': [{
                 'id': self.subdevice_id,
                 preset: target_temp
             }]})
 
         # Update local state
-        self.__temperature[preset] = target_temp
+        self._temp_presets[preset] = _from_decimals(target_temp)
 
     async def async_set_target_temperature(self, temperature: float) -> None:
         # The API expects the target temperature in DECIMALS, so we need to multiply the user's input by 10
         target_temp = temperature * 10
         payload = {'temperature': [{'id': self.subdevice_id, 'custom': target_temp}]}
         await self._hub._execute_command(method='SET',
-                                          namespace=Namespace.HUB_MTS100_TEMPERATURE,
+                                          namespace=_NS_HUB_MTS100_TEMPERATURE,
                                           payload=payload)
         # Update local state
-        self.__temperature['currentSet'] = target_temp
+        self._temp_current_set = _from_decimals(target_temp)
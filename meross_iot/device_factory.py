@@ -117,7 +117,11 @@ def _build_cached_type(type_string: str, device_abilities: dict, base_class: typ
     # Messing up with that will cause MRO to not resolve inheritance correctly.
     mixin_classes = list(mixin_classes)
     mixin_classes.append(base_class)
-    m = type(type_string, tuple(mixin_classes), {"_abilities_spec": device_abilities})
+
+    # Mixins cannot declare non-empty __slots__ (multiple bases with slots would have conflicting layouts),
+    # so they list their instance attributes in _MIXIN_SLOTS and the dynamic type declares them instead.
+    slots = tuple(slot for c in mixin_classes for slot in vars(c).get('_MIXIN_SLOTS', ()))
+    m = type(type_string, tuple(mixin_classes), {"_abilities_spec": device_abilities, "__slots__": slots})
     return m
 
 
@@ -204,7 +204,7 @@ class MerossHttpClient(object):
         :return:
         """
         result = await self._async_authenticated_post(_DEV_LIST, {}, cloud_creds=self._cloud_creds)
-        return [HttpDeviceInfo.from_dict(x) for x in result]
+        return HttpDeviceInfo.from_dict_list(result)
 
     async def async_list_hub_subdevices(self, hub_id: str) -> List[HttpSubdeviceInfo]:
         """
@@ -215,7 +215,7 @@ class MerossHttpClient(object):
         :return:
         """
         result = await self._async_authenticated_post(_HUB_DUBDEV_LIST, {"uuid": hub_id}, cloud_creds=self._cloud_creds)
-        return [HttpSubdeviceInfo.from_dict(x) for x in result]
+        return HttpSubdeviceInfo.from_dict_list(result)
 
 
 def _encode_params(parameters: dict):
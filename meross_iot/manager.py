@@ -1,18 +1,25 @@
 import asyncio
+import functools
+import itertools
 import json
 import logging
-import random
+import os
+import socket
 import ssl
-import string
-import sys
 import time
 from asyncio import Future
 from asyncio import TimeoutError
 from hashlib import md5
-from typing import Optional, List, TypeVar, Iterable
+from typing import Optional, List, TypeVar, Iterable, Tuple
 
 import paho.mqtt.client as mqtt
 
+try:
+    # orjson is an optional speedup for MQTT payload (de)serialization
+    import orjson
+except ImportError:
+    orjson = None
+
 from meross_iot.controller.device import BaseDevice, HubDevice, GenericSubDevice
 from meross_iot.device_factory import build_meross_device, build_meross_subdevice
 from meross_iot.http_api import MerossHttpClient
@@ -26,11 +33,38 @@ from meross_iot.model.push.generic import GenericPushNotification
 from meross_iot.utilities.mqtt import generate_mqtt_password, generate_client_and_app_id, build_client_response_topic, \
     build_client_user_topic, verify_message_signature, device_uuid_from_push_notification, build_device_request_topic
 
-logging.basicConfig(format='%(levelname)s:%(message)s', level=logging.INFO, stream=sys.stdout)
 _LOGGER = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseDevice)  # Declare type variable
 
+_ACK_METHODS = frozenset(('SETACK', 'GETACK', 'ERROR'))
+
+# Bounds for the paho client queues and kernel socket buffers, sized for bursts of PUSH notifications
+# (e.g. many devices reporting their online status at once)
+_MQTT_MAX_INFLIGHT_MESSAGES = 64
+_MQTT_MAX_QUEUED_MESSAGES = 1000
+_MQTT_SOCKET_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Both variants parse raw bytes and serialize to utf-8 encoded bytes
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+
+def _resolve_future(future: Future, result, exception: Optional[Exception]) -> None:
+    # The awaiter may have already given up (timeout/close) by the time the ACK is processed
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
 
 class MerossManager(object):
     """
@@ -59,6 +93,7 @@ class MerossManager(object):
         self._app_id, self._client_id = generate_client_and_app_id()
         self._pending_messages_futures = {}
         self._device_registry = DeviceRegistry()
+        self._key_bytes = self._cloud_creds.key.encode("utf8")
 
         # Setup mqtt client
         mqtt_pass = generate_mqtt_password(user_id=self._cloud_creds.user_id, key=self._cloud_creds.key)
@@ -68,25 +103,44 @@ class MerossManager(object):
         self._mqtt_client.on_disconnect = self._on_disconnect
         self._mqtt_client.on_subscribe = self._on_subscribe
         self._mqtt_client.username_pw_set(username=self._cloud_creds.user_id, password=mqtt_pass)
+        self._mqtt_client.max_inflight_messages_set(_MQTT_MAX_INFLIGHT_MESSAGES)
+        self._mqtt_client.max_queued_messages_set(_MQTT_MAX_QUEUED_MESSAGES)
         self._mqtt_client.tls_set(ca_certs=self._ca_cert, certfile=None,
                                   keyfile=None, cert_reqs=ssl.CERT_REQUIRED,
                                   tls_version=ssl.PROTOCOL_TLS,
                                   ciphers=None)
 
-        # Setup synchronization primitives
-        self._loop = asyncio.get_event_loop()
-        self._mqtt_connected_and_subscribed = asyncio.Event()
+        # Synchronization primitives are bound to the running loop by async_init()
+        self._loop = None
+        self._mqtt_connected_and_subscribed = None
 
         # Prepare MQTT topic names
         self._client_response_topic = build_client_response_topic(user_id=self._cloud_creds.user_id,
                                                                   app_id=self._app_id)
         self._user_topic = build_client_user_topic(user_id=self._cloud_creds.user_id)
+        # Topics to subscribe (QoS 0) on every (re)connection. paho expects a list: it is never modified.
+        self._subscriptions = [(self._user_topic, 0), (self._client_response_topic, 0)]
+        # Request topics of the devices this manager has sent commands to, by device uuid
+        self._device_topics = {}
+        # Outgoing message headers only differ in messageId/method/namespace/sign/timestamp: the rest is pre-encoded
+        self._header_prefix = b'{"header":{"from":' + _json_dumps(self._client_response_topic) + b',"messageId":"'
+        # Incoming messages are routed by destination topic (see _on_message)
+        self._message_dispatch = {
+            self._client_response_topic: self._handle_command_ack,
+            self._user_topic: self._handle_push_message
+        }
 
     def close(self):
         _LOGGER.info("Disconnecting from mqtt")
         self._mqtt_client.disconnect()
         _LOGGER.debug("Stopping the MQTT looper.")
         self._mqtt_client.loop_stop(True)
+        # Wake up whoever is still waiting for a command response: no ACK can arrive anymore
+        pending_futures = list(self._pending_messages_futures.values())
+        self._pending_messages_futures.clear()
+        for future in pending_futures:
+            if not future.done():
+                future.set_exception(UnconnectedError())
         _LOGGER.info("MQTT Client has fully disconnected.")
 
     def find_devices(self,
@@ -125,6 +179,17 @@ class MerossManager(object):
             internal_ids=internal_ids, device_type=device_type, device_class=device_class,
             device_name=device_name, online_status=online_status)
 
+    def get_device(self, device_uuid: str) -> Optional[BaseDevice]:
+        """
+        Returns the base (non-subdevice) device registered with the given Meross native UUID, if any.
+
+        :param device_uuid: Meross native device UUID
+
+        :return:
+            The matching device, or None if no such device has been discovered via this manager.
+        """
+        return self._device_registry.lookup_base_by_uuid(device_uuid)
+
     async def async_init(self) -> None:
         """
         Connects to the remote MQTT broker and subscribes to the relevant topics. This method should be
@@ -134,6 +199,10 @@ class MerossManager(object):
         if self.__initialized:
             raise RuntimeError("Manager was already initialized.")
 
+        # paho callbacks are marshalled to the loop running this coroutine
+        self._loop = asyncio.get_running_loop()
+        self._mqtt_connected_and_subscribed = asyncio.Event()
+
         _LOGGER.info("Initializing the MQTT connection...")
         self._mqtt_client.connect(host=self._domain, port=self._port, keepalive=30)
 
@@ -161,9 +230,12 @@ class MerossManager(object):
         # List http devices
         http_devices = await self._http_client.async_list_devices()
 
+        # Indexed by uuid, so that membership checks below do not rescan the whole list
+        http_devices_by_uuid = {h.uuid: h for h in http_devices}
+
         # Update state of local devices
         discovered_new_http_devices = []
-        for hdevice in http_devices:
+        for hdevice in http_devices_by_uuid.values():
             ldevice = self._device_registry.lookup_base_by_uuid(hdevice.uuid)
             if ldevice is not None:
                 _LOGGER.info(f"Updating state of device {ldevice.name} ({ldevice.uuid}) from HTTP info...")
@@ -182,50 +254,45 @@ class MerossManager(object):
             if isinstance(ldevice, GenericSubDevice):
                 continue
 
-            found_in_http = False
-            for hdevice in http_devices:
-                if hdevice.uuid == ldevice.uuid:
-                    found_in_http = True
-                    break
-            if not found_in_http:
+            if ldevice.uuid not in http_devices_by_uuid:
                 inconsistent_local_devices.append(ldevice)
                 _LOGGER.warning(f"Device {ldevice.name} ({ldevice.uuid}) is locally registered but has not been "
                                 f"reported by the last HTTP API device-list call.")
 
         # TODO: handle inconsistent devices?
         # For every newly discovered device, retrieve its abilities and then build a corresponding wrapper.
-        # Do this in "parallel" with multiple tasks rather than executing every task singularly
+        # Do this in "parallel" with multiple tasks rather than executing every task singularly.
+        # Hubs go on fetching their subdevices as soon as they are enrolled, without waiting for the other devices.
         tasks = []
         for d in discovered_new_http_devices:
-            tasks.append(self._loop.create_task(self._async_enroll_new_http_dev(d)))
-
-        # Wait for factory to build all devices
-        enrolled_devices = await asyncio.gather(*tasks, loop=self._loop)
-
-        # Let's now handle HubDevices. For every HubDevice we have, we need to fetch new possible subdevices
-        # from the HTTP API
-        subdevtasks = []
-        hubs = []
-        for d in enrolled_devices:
-            if isinstance(d, HubDevice):
-                hubs.append(d)
-                subdevs = await self._http_client.async_list_hub_subdevices(hub_id=d.uuid)
-                for sd in subdevs:
-                    subdevtasks.append(self._loop.create_task(
-                        self._async_enroll_new_http_subdev(subdevice_info=sd,
-                                                           hub=d,
-                                                           hub_reported_abilities=d._abilities)))
-
-        # Wait for factory to build all devices
-        enrolled_subdevices = await asyncio.gather(*tasks, loop=self._loop)
+            tasks.append(asyncio.create_task(self._async_enroll_new_http_dev_and_subdevices(d)))
+
+        # Wait for factory to build all devices (and hub subdevices)
+        enrolled_devices = await asyncio.gather(*tasks)
+        hubs = [d for d in enrolled_devices if isinstance(d, HubDevice)]
 
         # We need to update the state of hubs in order to refresh subdevices online status
-        if update_subdevice_status:
-            for h in hubs:
-                await h.async_update()
-        # TODO add result logging
+        # (concurrently: every hub update costs a full command round-trip)
+        if update_subdevice_status and hubs:
+            results = await asyncio.gather(*(h.async_update() for h in hubs), return_exceptions=True)
+            for h, result in zip(hubs, results):
+                if isinstance(result, BaseException):
+                    _LOGGER.error("Failed to update hub %s (%s): %r", h.name, h.uuid, result)
         _LOGGER.debug("HTTP async completed.")
 
+    async def _async_enroll_new_http_dev_and_subdevices(self, device_info: HttpDeviceInfo) -> Optional[BaseDevice]:
+        device = await self._async_enroll_new_http_dev(device_info)
+        if not isinstance(device, HubDevice):
+            return device
+
+        # For every HubDevice, we need to fetch new possible subdevices from the HTTP API
+        subdevs = await self._http_client.async_list_hub_subdevices(hub_id=device.uuid)
+        await asyncio.gather(*(self._async_enroll_new_http_subdev(subdevice_info=sd,
+                                                                  hub=device,
+                                                                  hub_reported_abilities=device._abilities)
+                               for sd in subdevs))
+        return device
+
     async def _async_enroll_new_http_subdev(self,
                                             subdevice_info: HttpSubdeviceInfo,
                                             hub: HubDevice,
@@ -264,16 +331,24 @@ class MerossManager(object):
         # NOTE! This method is called by the paho-mqtt thread, thus any invocation to the
         # asyncio platform must be scheduled via `self._loop.call_soon_threadsafe()` method.
 
-        _LOGGER.debug(f"Connected with result code {rc}")
+        _LOGGER.debug("Connected with result code %s", rc)
+        sock = client.socket()
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _MQTT_SOCKET_BUFFER_SIZE)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _MQTT_SOCKET_BUFFER_SIZE)
+            except OSError as e:
+                _LOGGER.warning("Could not resize the MQTT socket buffers: %s", e)
+
         # Subscribe to the relevant topics
         _LOGGER.debug("Subscribing to topics...")
-        client.subscribe([(self._user_topic, 0), (self._client_response_topic, 0)])
+        client.subscribe(self._subscriptions)
 
     def _on_disconnect(self, client, userdata, rc):
         # NOTE! This method is called by the paho-mqtt thread, thus any invocation to the
         # asyncio platform must be scheduled via `self._loop.call_soon_threadsafe()` method.
 
-        _LOGGER.info("Disconnection detected. Reason: %s" % str(rc))
+        _LOGGER.info("Disconnection detected. Reason: %s", rc)
 
         # If the client disconnected explicitly, the mqtt library handles thred stop autonomously
         if rc == mqtt.MQTT_ERR_SUCCESS:
@@ -305,7 +380,10 @@ class MerossManager(object):
     def _on_message(self, client, userdata, msg):
         # NOTE! This method is called by the paho-mqtt thread, thus any invocation to the
         # asyncio platform must be scheduled via `self._loop.call_soon_threadsafe()` method.
-        _LOGGER.debug(f"Received message from topic {msg.topic}: {str(msg.payload)}")
+        _LOGGER.debug("Received message from topic %s: %s", msg.topic, msg.payload)
+        if self._loop is None:
+            _LOGGER.warning("Message received before async_init() bound the manager to an event loop. Discarding it.")
+            return
 
         # In order to correctly dispatch a message, we should look at:
         # - message destination topic
@@ -325,61 +403,69 @@ class MerossManager(object):
         # has successfully changed the state of some device on the network.
 
         # Let's parse the message
-        message = json.loads(str(msg.payload, "utf8"))
-        header = message['header']
-        if not verify_message_signature(header, self._cloud_creds.key):
+        try:
+            message = _json_loads(msg.payload)
+            header = message['header']
+        except (ValueError, KeyError, TypeError):
+            _LOGGER.error("Malformed message received. Message will be discarded. Message: %s", msg.payload)
+            return
+        if not verify_message_signature(header, self._key_bytes):
             _LOGGER.error(f"Invalid signature received. Message will be discarded. Message: {msg.payload}")
             return
 
         _LOGGER.debug("Message signature OK")
 
-        # Let's retrieve the destination topic, message method and source party:
-        destination_topic = msg.topic
-        message_method = header.get('method')
-        source_topic = header.get('from')
-
         # Dispatch the message.
+        handler = self._message_dispatch.get(msg.topic)
+        if handler is None or not handler(header, message):
+            _LOGGER.warning(f"The current implementation of this library does not handle messages received on topic "
+                            f"({msg.topic}) and when the message method is {header.get('method')}. "
+                            "If you see this message many times, it means Meross has changed the way its protocol "
+                            "works. Contact the developer if that happens!")
+
+    def _handle_command_ack(self, header: dict, message: dict) -> bool:
         # Check case 2: COMMAND_ACKS. In this case, we don't check the source topic address, as we trust it's
         # originated by a device on this network that we contacted previously.
-        if destination_topic == build_client_response_topic(self._cloud_creds.user_id, self._app_id) and \
-                message_method in ['SETACK', 'GETACK', 'ERROR']:
-            _LOGGER.debug("This message is an ACK to a command this client has send.")
-
-            # If the message is a PUSHACK/GETACK/ERROR, check if there is any pending command waiting for it and, if so,
-            # resolve its future
-            message_id = header.get('messageId')
-            future = self._pending_messages_futures.get(message_id)
-            if future is not None:
-                _LOGGER.debug("Found a pending command waiting for response message")
-                if message_method == 'ERROR':
-                    err = CommandError(error_payload=message.payload)
-                    self._loop.call_soon_threadsafe(future.set_exception, err)
-                elif message_method in ('SETACK', 'GETACK'):
-                    self._loop.call_soon_threadsafe(future.set_result, message)
-                else:
-                    _LOGGER.error(f"Unhandled message method {message_method}. Please report it to the developer."
-                                  f"raw_msg: {msg}")
+        message_method = header.get('method')
+        if message_method not in _ACK_METHODS:
+            return False
+
+        _LOGGER.debug("This message is an ACK to a command this client has send.")
+
+        # If the message is a PUSHACK/GETACK/ERROR, check if there is any pending command waiting for it and, if so,
+        # resolve its future
+        message_id = header.get('messageId')
+        future = self._pending_messages_futures.pop(message_id, None)
+        if future is not None:
+            _LOGGER.debug("Found a pending command waiting for response message")
+            if message_method == 'ERROR':
+                err = CommandError(error_payload=message.get('payload'))
+                self._loop.call_soon_threadsafe(_resolve_future, future, None, err)
+            else:
+                self._loop.call_soon_threadsafe(_resolve_future, future, message, None)
+        return True
+
+    def _handle_push_message(self, header: dict, message: dict) -> bool:
         # Check case 3: PUSH notification.
         # Again, here we don't check the source topic, we trust that's legitimate.
-        elif destination_topic == build_client_user_topic(self._cloud_creds.user_id) and message_method == 'PUSH':
-            namespace = header.get('namespace')
-            payload = message.get('payload')
-            origin_device_uuid = device_uuid_from_push_notification(source_topic)
-
-            parsed_push_notification = parse_push_notification(namespace=namespace,
-                                                               message_payload=payload,
-                                                               originating_device_uuid=origin_device_uuid)
-            if parsed_push_notification is None:
-                _LOGGER.error("Push notification parsing failed. That message won't be dispatched.")
-            else:
-                asyncio.run_coroutine_threadsafe(self._dispatch_push_notification(parsed_push_notification), self._loop)
+        if header.get('method') != 'PUSH':
+            return False
+
+        namespace = header.get('namespace')
+        payload = message.get('payload')
+        origin_device_uuid = device_uuid_from_push_notification(header.get('from'))
+
+        parsed_push_notification = parse_push_notification(namespace=namespace,
+                                                           message_payload=payload,
+                                                           originating_device_uuid=origin_device_uuid)
+        if parsed_push_notification is None:
+            _LOGGER.error("Push notification parsing failed. That message won't be dispatched.")
         else:
-            _LOGGER.warning(f"The current implementation of this library does not handle messages received on topic "
-                            f"({destination_topic}) and when the message method is {message_method}. "
-                            "If you see this message many times, it means Meross has changed the way its protocol "
-                            "works. Contact the developer if that happens!")
+            # Dispatching is synchronous: just schedule it on the loop, no need for a coroutine/future pair
+            self._loop.call_soon_threadsafe(self._dispatch_push_notification, parsed_push_notification)
+        return True
 
-    async def _dispatch_push_notification(self, push_notification: GenericPushNotification) -> bool:
+    def _dispatch_push_notification(self, push_notification: GenericPushNotification) -> bool:
         """
         This method runs within the event loop and is responsible to deliver push notifications to the corresponding
         meross device within the register.
@@ -397,11 +483,16 @@ class MerossManager(object):
             # TODO: does it make sense to schedule a device discover at this stage without needing to warn the user?
             return False
 
-        # Pass the control to the specific device implementation
+        # Pass the control to the specific device implementation, unless none of its mixins handles
+        # that namespace: in that case there is no point in walking the whole handler chain.
         dev = target_devs[0]
-        handled = dev.handle_push_notification(namespace=push_notification.namespace, data=push_notification.raw_data)
+        if not dev.handles_push_notification(namespace=push_notification.namespace):
+            handled = False
+        else:
+            handled = dev.handle_push_notification(namespace=push_notification.namespace,
+                                                   data=push_notification.raw_data)
         if not handled:
-            _LOGGER.warning(f"Uncaught push notification {push_notification.namespace}")
+            _LOGGER.warning("Uncaught push notification %s", push_notification.namespace)
 
         return handled
 
@@ -417,7 +508,8 @@ class MerossManager(object):
         :param destination_device_uuid:
         :param method: Can be GET/SET
         :param namespace: Command namspace
-        :param payload: A dict containing the payload to be sent
+        :param payload: A dict containing the payload to be sent. It is serialized before this coroutine first
+                        awaits, so callers may reuse and mutate the same dict across calls.
         :param timeout:
 
         :return:
@@ -435,19 +527,58 @@ class MerossManager(object):
         self._pending_messages_futures[message_id] = fut
 
         response = await self._async_send_and_wait_ack(future=fut,
+                                                       message_id=message_id,
                                                        target_device_uuid=destination_device_uuid,
                                                        message=message,
                                                        timeout=timeout)
         return response.get('payload')
 
-    async def _async_send_and_wait_ack(self, future: Future, target_device_uuid: str, message: dict, timeout: float):
-        md = self._mqtt_client.publish(topic=build_device_request_topic(target_device_uuid), payload=message)
+    async def async_execute_cmds(self,
+                                 commands: Iterable[Tuple[str, str, Namespace, dict]],
+                                 timeout: float = 5.0) -> List:
+        """
+        Sends a batch of commands to the MQTT Meross broker. All the commands are published before waiting for
+        any response, so the whole batch takes about one round-trip rather than one per command.
+
+        :param commands: (destination_device_uuid, method, namespace, payload) tuples
+        :param timeout: applied to each command
+
+        :return: for each command, in order, either its response payload or the exception it raised
+        """
+        return await asyncio.gather(*(self.async_execute_cmd(destination_device_uuid, method, namespace, payload,
+                                                             timeout)
+                                      for destination_device_uuid, method, namespace, payload in commands),
+                                    return_exceptions=True)
+
+    async def _async_send_and_wait_ack(self, future: Future, message_id: str, target_device_uuid: str, message: dict,
+                                       timeout: float):
+        # The timeout covers both the publish and the wait for the response
+        deadline = self._loop.time() + timeout
         try:
-            return await asyncio.wait_for(future, timeout, loop=self._loop)
+            # paho publish() takes the client locks and may write to the socket: keep it off the event loop
+            md = await asyncio.wait_for(
+                self._loop.run_in_executor(None, functools.partial(self._mqtt_client.publish,
+                                                                   topic=self._device_topic(target_device_uuid),
+                                                                   payload=message)),
+                timeout)
+            if md.rc != mqtt.MQTT_ERR_SUCCESS:
+                _LOGGER.warning("The MQTT client did not accept the message for device %s (rc=%s). "
+                                "The command will likely time out.", target_device_uuid, md.rc)
+            return await asyncio.wait_for(future, max(deadline - self._loop.time(), 0))
         except TimeoutError as e:
             _LOGGER.error(f"Timeout occurred while waiting a response for message {message} sent to device uuid "
                           f"{target_device_uuid}. Timeout was: {timeout} seconds")
             raise CommandTimeoutError()
+        finally:
+            # Never leave the future behind: unanswered commands would otherwise pile up forever
+            self._pending_messages_futures.pop(message_id, None)
+
+    def _device_topic(self, device_uuid: str) -> str:
+        topic = self._device_topics.get(device_uuid)
+        if topic is None:
+            topic = build_device_request_topic(device_uuid)
+            self._device_topics[device_uuid] = topic
+        return topic
 
     def _build_mqtt_message(self, method: str, namespace: Namespace, payload: dict):
         """
@@ -460,41 +591,37 @@ class MerossManager(object):
         :return:
         """
 
-        # Generate a random 16 byte string
-        randomstring = ''.join(random.SystemRandom().choice(string.ascii_uppercase + string.digits) for _ in range(16))
-
-        # Hash it as md5
-        md5_hash = md5()
-        md5_hash.update(randomstring.encode('utf8'))
-        messageId = md5_hash.hexdigest().lower()
-        timestamp = int(round(time.time()))
+        # 16 random bytes, hex encoded: same format (32 lowercase hex chars) as the md5 digest used so far
+        messageId = os.urandom(16).hex()
+        timestamp = int(time.time())
+        # Each varying field is encoded once, then shared by the signature and the envelope
+        message_id_bytes = messageId.encode("ascii")
+        timestamp_bytes = str(timestamp).encode("ascii")
 
         # Hash the messageId, the key and the timestamp
-        md5_hash = md5()
-        strtohash = "%s%s%s" % (messageId, self._cloud_creds.key, timestamp)
-        md5_hash.update(strtohash.encode("utf8"))
-        signature = md5_hash.hexdigest().lower()
-
-        data = {
-            "header":
-                {
-                    "from": self._client_response_topic,
-                    "messageId": messageId,  # Example: "122e3e47835fefcd8aaf22d13ce21859"
-                    "method": method,  # Example: "GET",
-                    "namespace": namespace.value,  # Example: "Appliance.System.All",
-                    "payloadVersion": 1,
-                    "sign": signature,  # Example: "b4236ac6fb399e70c3d61e98fcb68b74",
-                    "timestamp": timestamp
-                },
-            "payload": payload
-        }
-        strdata = json.dumps(data)
-        return strdata.encode("utf-8"), messageId
+        signature = md5(message_id_bytes + self._key_bytes + timestamp_bytes).hexdigest()
+
+        # Same envelope as {"header": {...}, "payload": payload}, with the header fields in the same order.
+        # Example header: {"from": "/app/<userid>-<appid>/subscribe", "messageId": "122e3e47835fefcd8aaf22d13ce21859",
+        # "method": "GET", "namespace": "Appliance.System.All", "payloadVersion": 1,
+        # "sign": "b4236ac6fb399e70c3d61e98fcb68b74", "timestamp": 1600000000}
+        data = b'%s%s","method":"%s","namespace":"%s","payloadVersion":1,"sign":"%s","timestamp":%s},"payload":%s}' % (
+            self._header_prefix, message_id_bytes, method.encode("ascii"), namespace.value.encode("ascii"),
+            signature.encode("ascii"), timestamp_bytes, _json_dumps(payload))
+        return data, messageId
 
 
 class DeviceRegistry(object):
     def __init__(self):
         self._devices_by_internal_id = {}
+        # Secondary indexes, maintained upon enroll/relinquish: every device (hub subdevices included)
+        # grouped by uuid, and the only non-subdevice with that uuid
+        self._devices_by_uuid = {}
+        self._base_devices_by_uuid = {}
+        # Enrollment sequence number of every registered device (by internal id), so that narrowed lookups can
+        # return their results in registry order, as a full scan does
+        self._enrollment_seq = {}
+        self._next_enrollment_seq = itertools.count()
 
     def relinquish_device(self, device_id: str):
         dev = self._devices_by_internal_id.get(device_id)
@@ -503,9 +630,17 @@ class DeviceRegistry(object):
 
         # Dismiss the device
         # TODO: implement the dismiss() method to release device-held resources
-        _LOGGER.debug(f"Disposing resources for {dev.name} ({dev.uuid})")
+        _LOGGER.debug("Disposing resources for %s (%s)", dev.name, dev.uuid)
         dev.dismiss()
         del self._devices_by_internal_id[device_id]
+        del self._enrollment_seq[device_id]
+        same_uuid_devices = self._devices_by_uuid.get(dev.uuid)
+        if same_uuid_devices is not None:
+            same_uuid_devices.remove(dev)
+            if not same_uuid_devices:
+                del self._devices_by_uuid[dev.uuid]
+        if self._base_devices_by_uuid.get(dev.uuid) is dev:
+            del self._base_devices_by_uuid[dev.uuid]
         _LOGGER.info(f"Device {dev.name} ({dev.uuid}) removed from registry")
 
     def enroll_device(self, device: BaseDevice):
@@ -513,21 +648,18 @@ class DeviceRegistry(object):
             _LOGGER.warning(f"Device {device.name} ({device.internal_id}) has been already added to the registry.")
             return
         else:
-            _LOGGER.debug(f"Adding device {device.name} ({device.internal_id}) to registry.")
+            _LOGGER.debug("Adding device %s (%s) to registry.", device.name, device.internal_id)
             self._devices_by_internal_id[device.internal_id] = device
+            self._enrollment_seq[device.internal_id] = next(self._next_enrollment_seq)
+            self._devices_by_uuid.setdefault(device.uuid, []).append(device)
+            if not isinstance(device, GenericSubDevice):
+                self._base_devices_by_uuid[device.uuid] = device
 
     def lookup_by_id(self, device_id: str) -> Optional[BaseDevice]:
         return self._devices_by_internal_id.get(device_id)
 
     def lookup_base_by_uuid(self, device_uuid: str) -> Optional[BaseDevice]:
-        res = list(filter(lambda d: d.uuid == device_uuid and not isinstance(d, GenericSubDevice),
-                          self._devices_by_internal_id.values()))
-        if len(res) > 1:
-            raise ValueError(f"Multiple devices found for device_uuid {device_uuid}")
-        elif len(res) == 1:
-            return res[0]
-        else:
-            return None
+        return self._base_devices_by_uuid.get(device_uuid)
 
     def find_all_by(self,
                     device_uuids: Optional[Iterable[str]] = None,
@@ -537,21 +669,32 @@ class DeviceRegistry(object):
                     device_name: Optional[str] = None,
                     online_status: Optional[OnlineStatus] = None) -> List[BaseDevice]:
 
-        # Look by Internal UUIDs
+        # Ids are deduplicated without iterating a set, whose order depends on string hashing:
+        # the frozenset only serves membership tests.
         if internal_ids is not None:
-            res = filter(lambda d: d.internal_id in internal_ids, self._devices_by_internal_id.values())
-        else:
-            res = self._devices_by_internal_id.values()
-
+            internal_ids = tuple(dict.fromkeys(internal_ids))
         if device_uuids is not None:
-            res = filter(lambda d: d.uuid in device_uuids, res)
-        if device_type is not None:
-            res = filter(lambda d: d.type == device_type, res)
-        if online_status is not None:
-            res = filter(lambda d: d.online_status == online_status, res)
-        if device_class is not None:
-            res = filter(lambda d: isinstance(d, device_class), res)
-        if device_name is not None:
-            res = filter(lambda d: d.name == device_name, res)
-
-        return list(res)
+            device_uuids_order = tuple(dict.fromkeys(device_uuids))
+            device_uuids = frozenset(device_uuids_order)
+
+        # When looking by ids, only the matching entries of the indexes are scanned
+        if internal_ids is not None:
+            by_internal_id = self._devices_by_internal_id
+            candidates = [by_internal_id[i] for i in internal_ids if i in by_internal_id]
+        elif device_uuids is not None:
+            by_uuid = self._devices_by_uuid
+            candidates = [d for uuid in device_uuids_order for d in by_uuid.get(uuid, ())]
+        else:
+            candidates = self._devices_by_internal_id.values()
+        if len(candidates) > 1 and (internal_ids is not None or device_uuids is not None):
+            # Same (registry) order as a full scan would yield
+            enrollment_seq = self._enrollment_seq
+            candidates.sort(key=lambda d: enrollment_seq[d.internal_id])
+
+        # A single pass evaluating every active filter on each candidate
+        return [d for d in candidates
+                if (device_uuids is None or d.uuid in device_uuids)
+                and (device_type is None or d.type == device_type)
+                and (online_status is None or d.online_status == online_status)
+                and (device_class is None or isinstance(d, device_class))
+                and (device_name is None or d.name == device_name)]
@@ -12,6 +12,22 @@ class OnlineStatus(Enum):
     UNKNOWN = -1
 
 
+# Value -> member table, so that hot paths do not pay for the Enum value lookup machinery.
+# Members map to themselves, as already parsed statuses (e.g. from HttpDeviceInfo) go through here as well.
+_ONLINE_STATUS_BY_VALUE = {status.value: status for status in OnlineStatus}
+_ONLINE_STATUS_BY_VALUE.update({status: status for status in OnlineStatus})
+
+
+def parse_online_status(value: Union[int, OnlineStatus, None]) -> OnlineStatus:
+    """
+    Converts a raw online status value, as reported by the Meross cloud, into an OnlineStatus.
+    OnlineStatus members are returned as they are, unrecognized values are mapped to OnlineStatus.UNKNOWN.
+    :param value:
+    :return:
+    """
+    return _ONLINE_STATUS_BY_VALUE.get(value, OnlineStatus.UNKNOWN)
+
+
 class LightMode(Enum):
     MODE_LUMINANCE = 4
     MODE_TEMPERATURE = 2
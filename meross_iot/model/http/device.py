@@ -2,13 +2,19 @@ import logging
 from datetime import datetime
 from typing import Union, List
 
-from meross_iot.model.enums import OnlineStatus
-from meross_iot.model.shared import BaseDictPayload
+from meross_iot.model.enums import OnlineStatus, parse_online_status
+from meross_iot.model.shared import FrozenDictPayload, intern_str
+from meross_iot.utilities.conversion import utc_naive_from_timestamp
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class HttpDeviceInfo(BaseDictPayload):
+class HttpDeviceInfo(FrozenDictPayload):
+    __slots__ = ('uuid', 'online_status', 'dev_name', 'dev_icon_id', 'bind_time', 'device_type', 'sub_type',
+                 'channels', 'region', 'fmware_version', 'hdware_version', 'user_dev_icon', 'icon_type',
+                 'skill_number', 'domain', 'reserved_domain')
+    _KEY_FIELD = 'uuid'
+
     def __init__(self,
                  uuid: str,
                  online_status: Union[int, OnlineStatus],
@@ -25,38 +31,44 @@ class HttpDeviceInfo(BaseDictPayload):
                  icon_type: int,
                  skill_number: str,
                  domain: str,
-                 reserved_domain: str,
-                 *args, **kwargs):
-
-        super().__init__(*args, **kwargs)
-        self.uuid = uuid
-        if isinstance(online_status, int):
-            self.online_status = OnlineStatus(online_status)
-        elif isinstance(online_status, OnlineStatus):
-            self.online_status = online_status
+                 reserved_domain: str):
+        # Instances are immutable: fields are set bypassing FrozenDictPayload.__setattr__()
+        set_field = object.__setattr__
+        set_field(self, 'uuid', uuid)
+        # JSON payloads carry plain ints: check the exact type first, isinstance() only covers the odd subclass
+        status_type = type(online_status)
+        if status_type is int:
+            set_field(self, 'online_status', parse_online_status(online_status))
+        elif status_type is OnlineStatus:
+            set_field(self, 'online_status', online_status)
+        elif isinstance(online_status, int):
+            set_field(self, 'online_status', parse_online_status(online_status))
         else:
-            _LOGGER.warning(f"Provided online_status is not int neither OnlineStatus. It will be ignored.")
-            self.online_status = None
+            _LOGGER.warning("Provided online_status (%r) is not int neither OnlineStatus. It will be ignored.",
+                            online_status)
+            set_field(self, 'online_status', None)
 
-        self.dev_name = dev_name
-        self.dev_icon_id = dev_icon_id
-        if isinstance(bind_time, int):
-            self.bind_time = datetime.utcfromtimestamp(bind_time)
+        set_field(self, 'dev_name', dev_name)
+        set_field(self, 'dev_icon_id', dev_icon_id)
+        if type(bind_time) is int:
+            set_field(self, 'bind_time', utc_naive_from_timestamp(bind_time))
         elif isinstance(bind_time, datetime):
-            self.bind_time = bind_time
+            set_field(self, 'bind_time', bind_time)
+        elif isinstance(bind_time, int):
+            set_field(self, 'bind_time', utc_naive_from_timestamp(bind_time))
         else:
-            _LOGGER.warning(f"Provided bind_time is not int neither datetime. It will be ignored.")
-            self.bind_time = None
-
-        self.device_type = device_type
-        self.sub_type = sub_type
-        self.channels = channels
-        self.region = region
-        self.fmware_version = fmware_version
-        self.hdware_version = hdware_version
-        self.user_dev_icon = user_dev_icon
-        self.icon_type = icon_type
-        self.skill_number = skill_number
-        self.domain = domain
-        self.reserved_domain = reserved_domain
+            _LOGGER.warning("Provided bind_time (%r) is not int neither datetime. It will be ignored.", bind_time)
+            set_field(self, 'bind_time', None)
+
+        set_field(self, 'device_type', intern_str(device_type))
+        set_field(self, 'sub_type', intern_str(sub_type))
+        set_field(self, 'channels', channels)
+        set_field(self, 'region', intern_str(region))
+        set_field(self, 'fmware_version', fmware_version)
+        set_field(self, 'hdware_version', hdware_version)
+        set_field(self, 'user_dev_icon', user_dev_icon)
+        set_field(self, 'icon_type', icon_type)
+        set_field(self, 'skill_number', skill_number)
+        set_field(self, 'domain', intern_str(domain))
+        set_field(self, 'reserved_domain', intern_str(reserved_domain))
 
@@ -1,25 +1,28 @@
 import logging
 
-from meross_iot.model.shared import BaseDictPayload
+from meross_iot.model.shared import FrozenDictPayload, intern_str
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class HttpSubdeviceInfo(BaseDictPayload):
+class HttpSubdeviceInfo(FrozenDictPayload):
+    __slots__ = ('sub_device_id', 'true_id', 'sub_device_type', 'sub_device_vendor', 'sub_device_name',
+                 'sub_device_icon_id')
+    _KEY_FIELD = 'sub_device_id'
+
     def __init__(self,
                  sub_device_id: str,
                  true_id: str,
                  sub_device_type: str,
                  sub_device_vendor: str,
                  sub_device_name: str,
-                 sub_device_icon_id: str,
-                 *args, **kwargs):
-
-        super().__init__(*args, **kwargs)
-        self.sub_device_id = sub_device_id
-        self.true_id = true_id
-        self.sub_device_type = sub_device_type
-        self.sub_device_vendor = sub_device_vendor
-        self.sub_device_name = sub_device_name
-        self.sub_device_icon_id = sub_device_icon_id
+                 sub_device_icon_id: str):
+        # Instances are immutable: fields are set bypassing FrozenDictPayload.__setattr__()
+        set_field = object.__setattr__
+        set_field(self, 'sub_device_id', sub_device_id)
+        set_field(self, 'true_id', true_id)
+        set_field(self, 'sub_device_type', intern_str(sub_device_type))
+        set_field(self, 'sub_device_vendor', intern_str(sub_device_vendor))
+        set_field(self, 'sub_device_name', sub_device_name)
+        set_field(self, 'sub_device_icon_id', sub_device_icon_id)
 
@@ -1,20 +1,46 @@
-class PowerInfo(object):
-    def __init__(self, current_ampere: float, voltage_volts: float, power_watts: float):
-        self._current = current_ampere
-        self._voltage = voltage_volts
-        self._power = power_watts
+from array import array
+from collections import namedtuple
+from typing import Iterable, Iterator, List, Union
 
-    @property
-    def power(self) -> float:
-        return self._power
 
-    @property
-    def voltage(self) -> float:
-        return self._voltage
+class PowerInfo(namedtuple('PowerInfo', ('current', 'voltage', 'power'))):
+    __slots__ = ()
 
-    @property
-    def current(self) -> float:
-        return self._current
+    def __new__(cls, current_ampere: float, voltage_volts: float, power_watts: float):
+        return super().__new__(cls, current_ampere, voltage_volts, power_watts)
 
     def __str__(self):
-        return f"POWER = {self._power} W, VOLTAGE = {self._voltage} V, CURRENT = {self._current} A"
+        return f"POWER = {self.power} W, VOLTAGE = {self.voltage} V, CURRENT = {self.current} A"
+
+
+class PowerInfoBuffer(object):
+    """
+    Column-wise storage for a series of PowerInfo samples. Every measure is kept in a compact array of doubles,
+    rather than one object per sample, so that long histories and statistics over them stay cheap.
+    """
+    __slots__ = ('current', 'voltage', 'power')
+
+    def __init__(self, samples: Iterable[PowerInfo] = ()):
+        self.current = array('d')
+        self.voltage = array('d')
+        self.power = array('d')
+        for sample in samples:
+            self.append(sample)
+
+    def append(self, sample: PowerInfo) -> None:
+        self.current.append(sample.current)
+        self.voltage.append(sample.voltage)
+        self.power.append(sample.power)
+
+    def __len__(self):
+        return len(self.power)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[PowerInfo, List[PowerInfo]]:
+        if isinstance(index, slice):
+            return [PowerInfo(current, voltage, power) for current, voltage, power
+                    in zip(self.current[index], self.voltage[index], self.power[index])]
+        return PowerInfo(self.current[index], self.voltage[index], self.power[index])
+
+    def __iter__(self) -> Iterator[PowerInfo]:
+        for current, voltage, power in zip(self.current, self.voltage, self.power):
+            yield PowerInfo(current, voltage, power)
@@ -1,5 +1,8 @@
+import inspect
 import logging
 import re
+import sys
+from typing import Iterable
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -8,28 +11,138 @@ camel_pat = re.compile(r'([A-Z])')
 under_pat = re.compile(r'_([a-z])')
 
 
+# API responses keep using the same handful of keys: convert each of them only once
+_UNDERSCORE_KEYS = {}
+
+
 def _camel_to_underscore(key):
-    return camel_pat.sub(lambda x: '_' + x.group(1).lower(), key)
+    converted = _UNDERSCORE_KEYS.get(key)
+    if converted is None:
+        converted = camel_pat.sub(lambda x: '_' + x.group(1).lower(), key)
+        _UNDERSCORE_KEYS[key] = converted
+    return converted
 
 
 def _underscore_to_camel(key):
     return under_pat.sub(lambda x: x.group(1).upper(), key)
 
 
+def intern_str(value):
+    """
+    Interns the given value when it is a string: fields taking few distinct values across devices then share
+    the very same string object. Any other value is returned as is.
+    :param value:
+    :return:
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _slot_names(cls) -> tuple:
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name not in ('__dict__', '__weakref__'))
+    return tuple(names)
+
+
+# Placeholder default for the constructor parameters that have none
+_MISSING = object()
+
+# (attribute name, camel-case key) pairs stored in the __slots__ of each payload class, by class
+_SLOT_KEYS_BY_CLASS = {}
+
+
 class BaseDictPayload(object):
+    # Subclasses may declare __slots__ for their fields: to_dict() picks them up as well as any __dict__ entry
+    __slots__ = ()
+
+    # (parameter name, default value) of the subclass constructor, in positional order
+    _FIELDS = ()
+
     def __init__(self, *args, **kwargs):
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        params = tuple(inspect.signature(cls.__init__).parameters.values())[1:]
+        cls._FIELDS = tuple((p.name, _MISSING if p.default is inspect.Parameter.empty else p.default)
+                            for p in params if p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
     @classmethod
     def from_dict(cls, json_dict: dict):
         # Transform the camel-case notation into a more pythonian case
         new_dict = {_camel_to_underscore(key): value for (key, value) in json_dict.items()}
-        obj = cls(**new_dict)
-        return obj
+
+        # Only the fields accepted by the constructor are passed along, positionally
+        values = []
+        for name, default in cls._FIELDS:
+            value = new_dict.get(name, default)
+            if value is _MISSING:
+                # Let the constructor complain about the missing argument
+                accepted = {f for f, _ in cls._FIELDS}
+                return cls(**{k: v for k, v in new_dict.items() if k in accepted})
+            values.append(value)
+        return cls(*values)
+
+    @classmethod
+    def from_dict_list(cls, json_dicts: Iterable[dict]) -> list:
+        """
+        Builds one object per given dict, as from_dict() does for a single one.
+        :param json_dicts:
+        :return:
+        """
+        from_dict = cls.from_dict
+        return [from_dict(d) for d in json_dicts]
+
+    @classmethod
+    def _slot_keys(cls) -> tuple:
+        slot_keys = _SLOT_KEYS_BY_CLASS.get(cls)
+        if slot_keys is None:
+            slot_keys = tuple((name, _underscore_to_camel(name)) for name in _slot_names(cls))
+            _SLOT_KEYS_BY_CLASS[cls] = slot_keys
+        return slot_keys
 
     def to_dict(self) -> dict:
         res = {}
-        for k, v in vars(self).items():
+        for k, new_key in self._slot_keys():
+            res[new_key] = getattr(self, k)
+        for k, v in getattr(self, '__dict__', {}).items():
             new_key = _underscore_to_camel(k)
             res[new_key] = v
         return res
+
+
+class FrozenDictPayload(BaseDictPayload):
+    """
+    Immutable flavour of BaseDictPayload for slotted payloads. Fields can only be set by the constructor, via
+    object.__setattr__(). Instances compare equal field by field and hash by their _KEY_FIELD value.
+    """
+    __slots__ = ()
+
+    # Name of the field identifying the payload
+    _KEY_FIELD = None
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} objects are immutable: cannot set {key}")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{type(self).__name__} objects are immutable: cannot delete {key}")
+
+    # copy and pickle restore slots through setattr(): both go through object.__setattr__() instead
+    def __getstate__(self) -> dict:
+        return {k: getattr(self, k) for k, _ in self._slot_keys()}
+
+    def __setstate__(self, state: dict) -> None:
+        for k, v in state.items():
+            object.__setattr__(self, k, v)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, k) == getattr(other, k) for k, _ in self._slot_keys())
+
+    def __hash__(self):
+        # Strings cache their own hash, so this is cheap for the usual uuid/id keys
+        return hash(getattr(self, self._KEY_FIELD))
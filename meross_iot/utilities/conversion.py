@@ -1,5 +1,9 @@
+from datetime import datetime, timedelta
 from typing import Union
 
+# Naive UTC epoch, see utc_naive_from_timestamp()
+_UTC_EPOCH = datetime(1970, 1, 1)
+
 
 def rgb_to_int(rgb: Union[tuple, dict, int]) -> int:
     if isinstance(rgb, int):
@@ -27,3 +31,10 @@ def int_to_rgb(rgb: int) -> tuple:
     return red, green, blue
 
 
+def utc_naive_from_timestamp(timestamp: Union[int, float]) -> datetime:
+    """
+    Converts a unix timestamp into a naive UTC datetime, as the deprecated datetime.utcfromtimestamp() does.
+    :param timestamp:
+    :return:
+    """
+    return _UTC_EPOCH + timedelta(seconds=timestamp)
@@ -1,5 +1,6 @@
 import uuid as UUID
 from hashlib import md5
+from typing import Union
 
 def build_device_request_topic(client_uuid: str) -> str:
     """
@@ -67,15 +68,18 @@ def generate_mqtt_password(user_id: str, key: str):
     return md5_hash.hexdigest()
 
 
-def verify_message_signature(header: dict, key: str):
+def verify_message_signature(header: dict, key: Union[str, bytes]):
     """
     Verifies if the given message header has a valid signature
     :param header:
-    :param key:
+    :param key: device key, either as a string or already utf8-encoded
     :return:
     """
-    message_hash = md5()
-    strtohash = "%s%s%s" % (header['messageId'], key, header['timestamp'])
-    message_hash.update(strtohash.encode("utf8"))
-    expected_signature = message_hash.hexdigest().lower()
-    return expected_signature == header['sign']
+    if isinstance(key, str):
+        key = key.encode("utf8")
+    try:
+        strtohash = b"%s%s%s" % (str(header['messageId']).encode("utf8"), key, str(header['timestamp']).encode("utf8"))
+        expected_signature = md5(strtohash).hexdigest()
+        return expected_signature == str(header['sign']).lower()
+    except (KeyError, TypeError):
+        return False
@@ -0,0 +1,64 @@
+import copy
+import pickle
+import unittest
+
+from meross_iot.device_factory import build_meross_device
+from meross_iot.model.enums import OnlineStatus, Namespace
+from meross_iot.model.http.device import HttpDeviceInfo
+from meross_iot.model.http.subdevice import HttpSubdeviceInfo
+
+_HTTP_DEVICE = {
+    'uuid': '1234567890abcdef1234567890abcdef',
+    'onlineStatus': 1,
+    'devName': 'Test plug',
+    'devIconId': 'device045_it',
+    'bindTime': 1600000000,
+    'deviceType': 'mss310',
+    'subType': 'it',
+    'channels': [{}],
+    'region': 'eu',
+    'fmwareVersion': '2.1.4',
+    'hdwareVersion': '2.0.0',
+    'userDevIcon': '',
+    'iconType': 1,
+    'skillNumber': '',
+    'domain': 'eu-iot.meross.com',
+    'reservedDomain': 'eu-iot.meross.com'
+}
+
+_HTTP_SUBDEVICE = {
+    'subDeviceId': '01008C11',
+    'trueId': '0000000000000000',
+    'subDeviceType': 'ms100',
+    'subDeviceVendor': 'meross',
+    'subDeviceName': 'Test sensor',
+    'subDeviceIconId': 'device001'
+}
+
+
+class TestHttpDeviceInfo(unittest.TestCase):
+    def test_online_status_from_http_info(self):
+        info = HttpDeviceInfo.from_dict(_HTTP_DEVICE)
+        self.assertIs(info.online_status, OnlineStatus.ONLINE)
+
+    def test_device_online_status(self):
+        info = HttpDeviceInfo.from_dict(_HTTP_DEVICE)
+        abilities = {Namespace.SYSTEM_ALL.value: {}, Namespace.CONTROL_TOGGLEX.value: {}}
+        device = build_meross_device(http_device_info=info, device_abilities=abilities, manager=None)
+        self.assertEqual(device.online_status, OnlineStatus.ONLINE)
+
+    def test_offline_device_online_status(self):
+        info = HttpDeviceInfo.from_dict(dict(_HTTP_DEVICE, onlineStatus=2))
+        abilities = {Namespace.SYSTEM_ALL.value: {}, Namespace.CONTROL_TOGGLEX.value: {}}
+        device = build_meross_device(http_device_info=info, device_abilities=abilities, manager=None)
+        self.assertEqual(device.online_status, OnlineStatus.OFFLINE)
+
+    def test_copy_and_pickle(self):
+        info = HttpDeviceInfo.from_dict(_HTTP_DEVICE)
+        for clone in (copy.copy(info), copy.deepcopy(info), pickle.loads(pickle.dumps(info))):
+            self.assertEqual(clone, info)
+            self.assertEqual(clone.to_dict(), info.to_dict())
+
+        subdevice = HttpSubdeviceInfo.from_dict(_HTTP_SUBDEVICE)
+        for clone in (copy.copy(subdevice), copy.deepcopy(subdevice), pickle.loads(pickle.dumps(subdevice))):
+            self.assertEqual(clone, subdevice)
@@ -0,0 +1,32 @@
+import unittest
+
+from meross_iot.model.plugin.power import PowerInfo, PowerInfoBuffer
+
+_SAMPLES = [PowerInfo(0.1, 230.0, 23.0), PowerInfo(0.2, 231.0, 46.2), PowerInfo(0.3, 229.0, 68.7)]
+
+
+class TestPowerInfoBuffer(unittest.TestCase):
+    def test_append_and_len(self):
+        buffer = PowerInfoBuffer()
+        self.assertEqual(len(buffer), 0)
+        for sample in _SAMPLES:
+            buffer.append(sample)
+        self.assertEqual(len(buffer), len(_SAMPLES))
+
+    def test_indexing(self):
+        buffer = PowerInfoBuffer(_SAMPLES)
+        self.assertEqual(buffer[0], _SAMPLES[0])
+        self.assertEqual(buffer[-1], _SAMPLES[-1])
+        self.assertIsInstance(buffer[1], PowerInfo)
+        with self.assertRaises(IndexError):
+            buffer[len(_SAMPLES)]
+
+    def test_slicing(self):
+        buffer = PowerInfoBuffer(_SAMPLES)
+        self.assertEqual(buffer[1:], _SAMPLES[1:])
+        self.assertEqual(buffer[::-1], _SAMPLES[::-1])
+        self.assertEqual(buffer[5:], [])
+
+    def test_iteration(self):
+        buffer = PowerInfoBuffer(_SAMPLES)
+        self.assertEqual(list(buffer), _SAMPLES)
@@ -0,0 +1,55 @@
+import unittest
+
+from meross_iot.controller.device import BaseDevice
+from meross_iot.http_api import MerossHttpClient
+from meross_iot.manager import MerossManager
+from meross_iot.model.credentials import MerossCloudCreds
+from meross_iot.model.enums import Namespace
+from meross_iot.model.push.generic import GenericPushNotification
+
+_DEVICE_UUID = '1234567890abcdef1234567890abcdef'
+
+
+class _CustomPushDevice(BaseDevice):
+    """Overrides handle_push_notification without declaring its namespaces in _HANDLED_NAMESPACES"""
+    __slots__ = ('received',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.received = []
+
+    def handle_push_notification(self, namespace: Namespace, data: dict) -> bool:
+        self.received.append((namespace, data))
+        return True
+
+
+class TestPushDispatch(unittest.TestCase):
+    def setUp(self):
+        creds = MerossCloudCreds(token='token', key='key', user_id='0', user_email='user@example.com',
+                                 issued_on=None)
+        self.manager = MerossManager(http_client=MerossHttpClient(cloud_credentials=creds))
+
+    def _dispatch(self, namespace: Namespace, data: dict) -> bool:
+        return self.manager._dispatch_push_notification(
+            GenericPushNotification(namespace=namespace, originating_device_uuid=_DEVICE_UUID, raw_data=data))
+
+    def test_overriding_subclass_receives_pushes(self):
+        device = _CustomPushDevice(_DEVICE_UUID, manager=self.manager, devName='Custom', onlineStatus=1)
+        self.manager._device_registry.enroll_device(device)
+        data = {'togglex': {'channel': 0, 'onoff': 1}}
+
+        self.assertTrue(device.handles_push_notification(Namespace.CONTROL_TOGGLEX))
+        self.assertTrue(self._dispatch(Namespace.CONTROL_TOGGLEX, data))
+        self.assertEqual(device.received, [(Namespace.CONTROL_TOGGLEX, data)])
+
+    def test_unhandled_namespace_is_skipped(self):
+        class _PlainDevice(BaseDevice):
+            __slots__ = ()
+
+        device = _PlainDevice(_DEVICE_UUID, manager=self.manager, devName='Plain', onlineStatus=1)
+        self.manager._device_registry.enroll_device(device)
+
+        self.assertFalse(device.handles_push_notification(Namespace.CONTROL_TOGGLEX))
+        with self.assertLogs('meross_iot.manager', level='WARNING'):
+            self.assertFalse(self._dispatch(Namespace.CONTROL_TOGGLEX, {}))
+